@@ -0,0 +1,132 @@
+"""Benchmarks day 1 part 2 throughput against the size of the number word vocabulary, after
+first timing each extraction mode with the real 10-word vocabulary.
+
+Run with `python -m benchmarks.day_1.vocabulary_size`
+"""
+import random
+import re
+import string
+from time import perf_counter
+from typing import Callable, Dict, List
+
+from solutions.day_1.part_2 import NumberScanner, get_calibration_value, number_words
+
+vocabulary_sizes = [10, 100, 1000, 10000]
+line_count = 50
+line_length = 2000
+input_repeats = 300
+"""How many times the puzzle input is run through for the real-vocabulary timings"""
+long_line_count = 1000
+long_line_length = 3000
+
+
+def random_vocabulary(size: int, rng: random.Random) -> Dict[str, str]:
+    """Builds a vocabulary of random lowercase words (plus the English words) each mapped to a digit. The
+    words are long enough to rarely show up in the noise, so throughput reflects the per-character cost"""
+    vocabulary = dict(number_words)
+    while len(vocabulary) < size:
+        word = ''.join(rng.choices(string.ascii_lowercase, k=rng.randint(5, 10)))
+        vocabulary[word] = str(rng.randrange(10))
+    return vocabulary
+
+
+def random_lines(rng: random.Random, line_count: int = line_count, line_length: int = line_length) -> List[str]:
+    """Builds long noisy lines with a single digit near each end"""
+    lines = []
+    for _ in range(line_count):
+        noise = ''.join(rng.choices(string.ascii_lowercase, k=line_length))
+        lines.append(f'{noise[:line_length // 4]}{rng.randrange(10)}{noise[line_length // 4:-line_length // 4]}{rng.randrange(10)}{noise[-line_length // 4:]}')
+    return lines
+
+
+def regex_calibration_value(vocabulary: Dict[str, str]) -> Callable[[str], int]:
+    """The previous approach: one alternation regex with a greedy `.*` to reach the last token.
+    Shorter words go first so that, like the scanner, the shortest token wins when several start at the same spot.
+    """
+    alternation = '|'.join(sorted(vocabulary.keys(), key=len))
+    matcher = re.compile(f'(?P<first_num>\\d|{alternation})(.*(?P<last_num>\\d|{alternation}))?')
+
+    def get_value(code: str) -> int:
+        match_groups = matcher.search(code).groupdict()
+        first_num = match_groups['first_num']
+        last_num = match_groups['last_num'] or first_num
+        return int(vocabulary.get(first_num, first_num) + vocabulary.get(last_num, last_num))
+
+    return get_value
+
+
+def total_seconds(get_value: Callable[[str], int], lines: List[str]) -> float:
+    start = perf_counter()
+    for line in lines:
+        get_value(line)
+    return perf_counter() - start
+
+
+def compare_real_vocabulary(rng: random.Random) -> None:
+    """Times every mode with the English number words alone, which is what the puzzle uses.
+    At this size the regex engine's C loop beats the pure-Python automaton, so `scan` is only
+    worth opting into for much larger vocabularies.
+    """
+    with open('resources/day_1_values.txt', encoding='utf-8') as input_data:
+        codes = [ line.strip() for line in input_data if line.strip() ]
+    workloads = {
+        f'input x{input_repeats}': codes * input_repeats,
+        f'{long_line_count} x {long_line_length} chars': random_lines(rng, long_line_count, long_line_length),
+    }
+
+    scanner = NumberScanner(number_words)
+    modes: Dict[str, Callable[[str], int]] = {
+        'scan': lambda code: get_calibration_value(code, 'scan', scanner),
+        'bidirectional': lambda code: get_calibration_value(code, 'bidirectional', scanner),
+        'regex': regex_calibration_value(number_words),
+    }
+
+    print(f'Real {len(number_words)}-word vocabulary, total time in seconds')
+    print(f'{"workload":>22} {"scan":>10} {"bidirectional":>14} {"regex":>10}')
+    for workload_name, lines in workloads.items():
+        times = { mode_name: total_seconds(get_value, lines) for mode_name, get_value in modes.items() }
+        print(f'{workload_name:>22} {times["scan"]:>10.3f} {times["bidirectional"]:>14.3f} {times["regex"]:>10.3f}')
+    print()
+
+
+def chars_per_second(get_value: Callable[[str], int], lines: List[str]) -> float:
+    start = perf_counter()
+    for line in lines:
+        get_value(line)
+    return sum(len(line) for line in lines) / (perf_counter() - start)
+
+
+def main():
+    rng = random.Random(1)
+    compare_real_vocabulary(rng)
+    lines = random_lines(rng)
+
+    print(f'{line_count} lines of {line_length} characters, throughput in characters per second')
+    print(f'{"vocabulary":>10} {"build (s)":>10} {"scan":>12} {"bidirectional":>14} {"regex":>12}')
+    for size in vocabulary_sizes:
+        vocabulary = random_vocabulary(size, rng)
+
+        start = perf_counter()
+        scanner = NumberScanner(vocabulary)
+        build_time = perf_counter() - start
+
+        def scan_value(code: str) -> int:
+            first_digit, last_digit = scanner.find_first_and_last(code)
+            return int(first_digit + last_digit)
+
+        def bidirectional_value(code: str) -> int:
+            return int(scanner.find_first(code) + scanner.find_last(code))
+
+        regex_value = regex_calibration_value(vocabulary)
+        for line in lines:
+            if not scan_value(line) == bidirectional_value(line) == regex_value(line):
+                raise RuntimeError(f'Extraction modes disagree on line: {line}')
+
+        print(
+            f'{size:>10} {build_time:>10.3f} {chars_per_second(scan_value, lines):>12,.0f}'
+            f' {chars_per_second(bidirectional_value, lines):>14,.0f} {chars_per_second(regex_value, lines):>12,.0f}'
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""Benchmarks the memory held per game by each day 2 record layout.
+
+Run with `python -m benchmarks.day_2.record_size [game_count]` (default 10^6 games)
+"""
+import re
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from itertools import cycle, islice
+from typing import Callable, Dict, Iterator, List
+
+from solutions.day_2.records import ColorSchema, GameRecord, GameTable, default_colors, parse_game_maxima, parse_game_results
+
+
+@dataclass
+class DataclassGameResult:
+    """The previous layout: a dataclass holding one dict per round"""
+    game_num: int
+    round_results: List[Dict[str, int]]
+
+
+def parse_dataclass_game_result(line: str) -> DataclassGameResult:
+    game_num = int(re.search(r"Game (\d+):", line).groups()[0])
+    game_result_str = re.split(r"Game \d+:", line)[1].strip()
+    round_results = [
+        { match["color"]: int(match["count"]) for match in re.finditer(r"(?P<count>\d+) (?P<color>red|blue|green)", round) }
+        for round in re.split("; ", game_result_str)
+    ]
+    return DataclassGameResult(game_num, round_results)
+
+
+def generate_lines(game_count: int) -> Iterator[str]:
+    """Cycles through the puzzle input, renumbering the games"""
+    with open("resources/day_2_values.txt", encoding="utf-8") as input_data:
+        results = [ line.split(":", 1)[1] for line in input_data if line.strip() ]
+    for game_num, result in enumerate(islice(cycle(results), game_count), start=1):
+        yield f"Game {game_num}:{result}"
+
+
+def measure(build: Callable[[int], object], game_count: int) -> float:
+    """Returns the bytes per game still held once everything has been built"""
+    tracemalloc.start()
+    held = build(game_count)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+    return size / game_count
+
+
+def build_dataclass_results(game_count: int) -> object:
+    return [ parse_dataclass_game_result(line) for line in generate_lines(game_count) ]
+
+
+def build_slots_results(game_count: int) -> object:
+    schema = ColorSchema(default_colors)
+    return [ parse_game_results(line, schema) for line in generate_lines(game_count) ]
+
+
+def build_game_records(game_count: int) -> object:
+    schema = ColorSchema(default_colors)
+    records = []
+    for line in generate_lines(game_count):
+        game_num, maxima = parse_game_maxima(line, schema)
+        records.append(GameRecord(game_num, tuple(maxima)))
+    return records
+
+
+def build_game_table(game_count: int) -> object:
+    schema = ColorSchema(default_colors)
+    game_table = GameTable(schema)
+    for line in generate_lines(game_count):
+        game_table.append(*parse_game_maxima(line, schema))
+    return game_table
+
+
+def main():
+    game_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10 ** 6
+    raw_bytes = sum(len(line.encode()) + 1 for line in generate_lines(game_count)) / game_count
+
+    print(f"{game_count:,} games, raw input averages {raw_bytes:.1f} bytes per game")
+    print(f'{"layout":<40} {"bytes/game":>12} {"x raw":>8}')
+    layouts = [
+        ("dataclass + dict per round", build_dataclass_results),
+        ("__slots__ GameResult + vector per round", build_slots_results),
+        ("__slots__ GameRecord of maxima", build_game_records),
+        ("GameTable (packed arrays)", build_game_table),
+    ]
+    for name, build in layouts:
+        bytes_per_game = measure(build, game_count)
+        print(f"{name:<40} {bytes_per_game:>12.1f} {bytes_per_game / raw_bytes:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Benchmarks building and searching a single almanac map as its number of ranges grows.
+
+Run with `python -m benchmarks.day_5.map_size [legacy_max_range_count]`
+"""
+import random
+import sys
+from io import StringIO
+from math import floor
+from time import perf_counter
+from typing import List
+
+from solutions.day_5.part_1 import IdMap, IdMapTree
+
+range_counts = [10 ** 3, 10 ** 4, 10 ** 5]
+legacy_max_range_count = 10 ** 4
+"""The previous implementation is quadratic to build (minutes at 10^5), so it is skipped beyond this size by default"""
+lookup_count = 10 ** 4
+
+
+def random_map_lines(range_count: int, rng: random.Random) -> List[str]:
+    """Builds shuffled, non-overlapping ranges with gaps between them"""
+    lines = []
+    source_start = 0
+    for _ in range(range_count):
+        source_start += rng.randint(0, 50)
+        range_length = rng.randint(1, 100)
+        lines.append(f'{rng.randrange(10 ** 9)} {source_start} {range_length}')
+        source_start += range_length
+    rng.shuffle(lines)
+    return lines
+
+
+def legacy_build(lines: List[str]) -> List[IdMap]:
+    """The previous construction: a linear scan for the insert position of each range"""
+    map_list: List[IdMap] = []
+    for line in lines:
+        new_map = IdMap.from_text(line)
+        for idx, id_map in enumerate(map_list):
+            if new_map.source_range_start < id_map.source_range_start:
+                map_list.insert(idx, new_map)
+                break
+        else:
+            map_list.append(new_map)
+    return map_list
+
+
+def legacy_convert_value(map_list: List[IdMap], num: int) -> int:
+    """The previous lookup: a binary search that copies and re-slices the list on every probe"""
+    map_list = map_list.copy()
+    while len(map_list) > 0:
+        mid_idx = floor(len(map_list) / 2)
+        curr_map = map_list[mid_idx]
+        match curr_map.compare_to_source(num):
+            case 0:
+                return curr_map.convert_source_to_target(num)
+            case 1:
+                map_list = map_list[(mid_idx + 1) : len(map_list)]
+            case -1:
+                map_list = map_list[0 : (mid_idx)]
+    return num
+
+
+def main():
+    legacy_limit = int(sys.argv[1]) if len(sys.argv) > 1 else legacy_max_range_count
+    rng = random.Random(5)
+    print(f'{lookup_count:,} lookups per map, times in seconds')
+    print(f'{"ranges":>8} {"build":>10} {"lookups":>10} {"legacy build":>14} {"legacy lookups":>16}')
+    for range_count in range_counts:
+        lines = random_map_lines(range_count, rng)
+        lookups = [ rng.randrange(100 * range_count) for _ in range(lookup_count) ]
+
+        start = perf_counter()
+        id_map_tree = IdMapTree.from_file(StringIO('\n'.join(['seed-to-soil map:', *lines])))
+        build_time = perf_counter() - start
+
+        start = perf_counter()
+        converted = [ id_map_tree.convert_value(num, 'seed-to-soil') for num in lookups ]
+        lookup_time = perf_counter() - start
+
+        if range_count <= legacy_limit:
+            start = perf_counter()
+            map_list = legacy_build(lines)
+            legacy_build_time = f'{perf_counter() - start:>14.3f}'
+
+            start = perf_counter()
+            legacy_converted = [ legacy_convert_value(map_list, num) for num in lookups ]
+            legacy_lookup_time = f'{perf_counter() - start:>16.3f}'
+
+            if legacy_converted != converted:
+                raise RuntimeError('Legacy and current lookups disagree')
+        else:
+            legacy_build_time = f'{"skipped":>14}'
+            legacy_lookup_time = f'{"skipped":>16}'
+
+        print(f'{range_count:>8,} {build_time:>10.3f} {lookup_time:>10.3f} {legacy_build_time} {legacy_lookup_time}')
+
+
+if __name__ == '__main__':
+    main()
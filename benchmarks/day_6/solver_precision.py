@@ -0,0 +1,108 @@
+"""Benchmarks the day_6 race solvers across race times from 10^1 to 10^200, checking every count
+they give against an exact oracle.
+
+Run with `python -m benchmarks.day_6.solver_precision [--races N] [--show-mismatches]`
+"""
+import argparse
+import random
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+from solutions.day_6 import part_1, part_2
+from tests.day_6.oracle import count_winning_times_bisect
+
+magnitudes = [1, 2, 3, 4, 6, 8, 10, 12, 15, 16, 17, 18, 20, 30, 50, 100, 150, 200]
+brute_force_max_race_time = 10 ** 4
+"""Races up to this long are checked by trying every hold time, longer ones by bisection"""
+
+Race = Tuple[int, int]
+
+
+def count_by_range(solver: Callable[[int, int], range]) -> Callable[[int, int], int]:
+    """Adapts a solver returning an inclusive range of hold times to one returning a count"""
+    def count(race_time: int, best_distance: int) -> int:
+        time_range = solver(race_time, best_distance)
+        return time_range.stop - time_range.start + 1
+    return count
+
+solvers: Dict[str, Callable[[int, int], int]] = {
+    'part_1 search': count_by_range(part_1.calculate_button_hold_times),
+    'part_2 search': count_by_range(part_2.calculate_button_hold_times),
+    'exact': count_by_range(part_1.calculate_button_hold_times_exact),
+}
+
+
+def oracle_count(race_time: int, best_distance: int) -> int:
+    """Counts winning hold times with nothing but integer arithmetic, trying every hold time
+    for short races and bisecting for long ones
+    """
+    if race_time <= brute_force_max_race_time:
+        return sum(1 for hold in range(race_time + 1) if hold * (race_time - hold) > best_distance)
+    return count_winning_times_bisect(race_time, best_distance)
+
+
+def random_races(magnitude: int, race_count: int, rng: random.Random) -> List[Race]:
+    """Builds races with times of the given magnitude: half with records anywhere up to the best
+    possible distance, and half with records just under it, where the winning window is narrowest
+    """
+    races = []
+    for idx in range(race_count):
+        race_time = rng.randrange(10 ** magnitude, 10 ** (magnitude + 1))
+        best_possible = (race_time // 2) * (race_time - race_time // 2)
+        if idx % 2 == 0:
+            races.append((race_time, rng.randint(0, best_possible)))
+        else:
+            races.append((race_time, best_possible - rng.randint(1, max(race_time, 2))))
+    return races
+
+
+def time_solver(solver: Callable[[int, int], int], races: List[Race]) -> Tuple[List[int | None], float]:
+    """Runs a solver over every race, counting races it raises on as having no answer"""
+    counts: List[int | None] = []
+    start = perf_counter()
+    for race_time, best_distance in races:
+        try:
+            counts.append(solver(race_time, best_distance))
+        except (ArithmeticError, ValueError):
+            counts.append(None)
+    return counts, perf_counter() - start
+
+
+def time_batch(races: List[Race]) -> Tuple[List[int | None], float]:
+    race_times, best_distances = zip(*races)
+    start = perf_counter()
+    counts = part_1.count_winning_times_batch(race_times, best_distances).tolist()
+    return counts, perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--races', type=int, default=200, help='races per magnitude')
+    parser.add_argument('--show-mismatches', action='store_true', help='print every race a solver gets wrong')
+    args = parser.parse_args()
+
+    rng = random.Random(6)
+    part_1.count_winning_times_batch([], []) # Warms up the NumPy import, so it's not timed
+    mismatches: List[Tuple[str, Race, int, int | None]] = []
+    print(f'{args.races:,} races per magnitude, times in microseconds per race')
+    print(f'{"race time":>10} {"solver":>14} {"latency":>10} {"wrong":>7}')
+    for magnitude in magnitudes:
+        races = random_races(magnitude, args.races, rng)
+        expected = [ oracle_count(race_time, best_distance) for race_time, best_distance in races ]
+
+        results = { name: time_solver(solver, races) for name, solver in solvers.items() }
+        if max(race_time for race_time, _ in races) <= part_1.max_batch_race_time:
+            results['batch'] = time_batch(races)
+
+        for name, (counts, elapsed) in results.items():
+            wrong = [ (name, race, expected_count, count) for race, expected_count, count in zip(races, expected, counts) if count != expected_count ]
+            mismatches.extend(wrong)
+            print(f'{f"10^{magnitude}":>10} {name:>14} {elapsed / len(races) * 1e6:>10.2f} {len(wrong):>7,}')
+
+    if args.show_mismatches:
+        for name, (race_time, best_distance), expected_count, count in mismatches:
+            print(f'{name}: time={race_time} distance={best_distance} expected={expected_count} got={count}')
+
+
+if __name__ == '__main__':
+    main()
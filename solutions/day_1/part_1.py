@@ -1,15 +1,102 @@
-from resources.day_1_values import codes
+import argparse
+import sys
+from typing import Iterable, Iterator, Literal, TextIO
 import re
 
-totalValue = 0
-for code in codes:
-  result = re.search('\d(.*\d)?', code)
-  match = result.group()
+ExtractionMode = Literal['regex', 'bidirectional']
+"""How digits are pulled out of a code: `regex` matches across the whole code, while `bidirectional`
+scans in from each end and stops at the first digit found on each side
+"""
 
-  # Combine the first and last digit as strings, then convert to a number and add to the total value
-  firstDigit = match[0]
-  lastDigit = match[-1]
-  combinedValue = int(firstDigit + lastDigit)
-  totalValue += combinedValue
+digits = '0123456789'
 
-print(totalValue)
+def find_first_digit(code: str) -> str:
+  """Scans forward from the start of the code until a digit is found"""
+  for char in code:
+    if char in digits:
+      return char
+  raise ValueError(f'No digits found in code: {code}')
+
+def find_last_digit(code: str) -> str:
+  """Scans backward from the end of the code until a digit is found"""
+  for char in reversed(code):
+    if char in digits:
+      return char
+  raise ValueError(f'No digits found in code: {code}')
+
+def get_calibration_value(code: str, mode: ExtractionMode = 'bidirectional') -> int:
+  """Combines the first and last digit as strings, then converts them to a number"""
+  if mode == 'regex':
+    result = re.search(r'\d(.*\d)?', code)
+    if result is None:
+      raise ValueError(f'No digits found in code: {code}')
+    match = result.group()
+    firstDigit = match[0]
+    lastDigit = match[-1]
+  else:
+    firstDigit = find_first_digit(code)
+    lastDigit = find_last_digit(code)
+
+  return int(firstDigit + lastDigit)
+
+def read_codes(file: TextIO) -> Iterator[str]:
+  """Streams codes out of a file one line at a time, skipping blank lines"""
+  for line in file:
+    code = line.strip()
+    if code:
+      yield code
+
+def sum_calibration_values(codes: Iterable[str], mode: ExtractionMode = 'bidirectional') -> int:
+  totalValue = 0
+  for code in codes:
+    totalValue += get_calibration_value(code, mode)
+
+  return totalValue
+
+def sum_calibration_values_bulk(data: bytes) -> int:
+  """Sums the calibration values of every line in a buffer at once, without a per-line loop.
+
+  Digits are found with vectorized masks, then tagged with the line they sit on so that the first
+  and last digit of each line can be picked out where the line number changes. Unlike the per-line
+  path, lines without any digits are skipped rather than raising.
+  """
+  import numpy as np # Only needed for bulk mode
+
+  buffer = np.frombuffer(data, dtype=np.uint8)
+  digit_positions = np.flatnonzero((buffer >= ord('0')) & (buffer <= ord('9')))
+  if digit_positions.size == 0:
+    return 0
+
+  newline_positions = np.flatnonzero(buffer == ord('\n'))
+  line_ids = np.searchsorted(newline_positions, digit_positions)
+  line_changes = line_ids[1:] != line_ids[:-1]
+  first_positions = digit_positions[np.concatenate(([True], line_changes))]
+  last_positions = digit_positions[np.concatenate((line_changes, [True]))]
+
+  firstDigits = buffer[first_positions].astype(np.int64) - ord('0')
+  lastDigits = buffer[last_positions].astype(np.int64) - ord('0')
+  return int((firstDigits * 10 + lastDigits).sum())
+
+def main():
+  """Sums the calibration values from the given file, or from stdin if it is `-`"""
+  parser = argparse.ArgumentParser()
+  parser.add_argument('path', nargs='?', default='resources/day_1_values.txt')
+  parser.add_argument('--bulk', action='store_true', help='read the whole input at once and sum it with NumPy')
+  args = parser.parse_args()
+
+  if args.bulk:
+    if args.path == '-':
+      totalValue = sum_calibration_values_bulk(sys.stdin.buffer.read())
+    else:
+      with open(args.path, 'rb') as file:
+        totalValue = sum_calibration_values_bulk(file.read())
+  elif args.path == '-':
+    totalValue = sum_calibration_values(read_codes(sys.stdin))
+  else:
+    with open(args.path, encoding='utf-8') as file:
+      totalValue = sum_calibration_values(read_codes(file))
+
+  print(totalValue)
+
+if __name__ == '__main__':
+  main()
@@ -1,29 +1,185 @@
-from resources.day_1_values import codes
+import argparse
+import sys
+from typing import Dict, Iterable, Iterator, List, Literal, Optional, TextIO, Tuple
+
+ExtractionMode = Literal['scan', 'bidirectional']
+"""How digits are pulled out of a code: `scan` runs the automaton across the whole code, while
+`bidirectional` scans in from each end and stops at the first digit token found on each side.
+`scan` is opt-in, since it never stops early and only pays off for large vocabularies.
+"""
 
 number_words = { 'zero': '0', 'one': '1', 'two': '2', 'three': '3', 'four': '4', 'five': '5', 'six': '6', 'seven': '7', 'eight': '8', 'nine': '9' }
-number_words_regex = '|'.join(number_words.keys())
 
-def word_is_number(word):
-  return word in number_words
+number_vocabularies: Dict[str, Dict[str, str]] = {
+  'en': number_words,
+  'de': { 'null': '0', 'eins': '1', 'zwei': '2', 'drei': '3', 'vier': '4', 'fünf': '5', 'sechs': '6', 'sieben': '7', 'acht': '8', 'neun': '9' },
+  'es': { 'cero': '0', 'uno': '1', 'dos': '2', 'tres': '3', 'cuatro': '4', 'cinco': '5', 'seis': '6', 'siete': '7', 'ocho': '8', 'nueve': '9' },
+  'fr': { 'zéro': '0', 'un': '1', 'deux': '2', 'trois': '3', 'quatre': '4', 'cinq': '5', 'six': '6', 'sept': '7', 'huit': '8', 'neuf': '9' },
+  'it': { 'zero': '0', 'uno': '1', 'due': '2', 'tre': '3', 'quattro': '4', 'cinque': '5', 'sei': '6', 'sette': '7', 'otto': '8', 'nove': '9' },
+}
+
+def build_vocabulary(languages: Iterable[str] = ('en',), custom_tokens: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+  """Merges the number words of the given languages and any custom tokens into one vocabulary"""
+  vocabulary: Dict[str, str] = {}
+  word_sets = [ number_vocabularies[language] for language in languages ]
+  if custom_tokens:
+    word_sets.append(custom_tokens)
+
+  for words in word_sets:
+    for word, digit in words.items():
+      if digit not in '0123456789' or len(digit) != 1:
+        raise ValueError(f'Token {word} must map to a single digit, not {digit}')
+      if vocabulary.get(word, digit) != digit:
+        raise ValueError(f'Token {word} maps to both {vocabulary[word]} and {digit}')
+      vocabulary[word] = digit
+
+  return vocabulary
+
+class NumberScanner:
+  """Finds digit tokens (plain digits or number words) in a line in a single linear pass.
+
+  The tokens are compiled once into an Aho-Corasick automaton, so each character costs a single
+  transition no matter how many tokens there are. Matching never consumes characters, which means
+  overlapping words like "twone" both get reported. The transitions run in pure Python though, so
+  with only the 10 English words a regex is still quicker; the automaton only pulls ahead once
+  vocabularies reach hundreds of words (see `benchmarks/day_1/vocabulary_size.py`).
+  """
+
+  def __init__(self, words: Dict[str, str]):
+    tokens = { str(digit): str(digit) for digit in range(10) }
+    tokens.update(words)
+
+    # Build the trie, where each state holds the tokens (as (length, digit) pairs) ending there
+    goto: List[Dict[str, int]] = [{}]
+    self.outputs: List[List[Tuple[int, str]]] = [[]]
+    self.token_digits: List[Optional[str]] = [None]
+    for token, digit in tokens.items():
+      state = 0
+      for char in token:
+        if char not in goto[state]:
+          goto[state][char] = len(goto)
+          goto.append({})
+          self.outputs.append([])
+          self.token_digits.append(None)
+        state = goto[state][char]
+      self.outputs[state].append((len(token), digit))
+      self.token_digits[state] = digit
+    self.trie = goto
+
+    # Add failure links breadth-first, folding them into the transitions so that the scan never
+    # has to backtrack
+    self.transitions: List[Dict[str, int]] = [dict(goto[0])]
+    self.transitions.extend({} for _ in range(1, len(goto)))
+    fail = [0] * len(goto)
+    queue = list(goto[0].values())
+    for state in queue:
+      fail_state = fail[state]
+      self.outputs[state] = self.outputs[state] + self.outputs[fail_state]
+      self.transitions[state] = { **self.transitions[fail_state], **goto[state] }
+      for char, next_state in goto[state].items():
+        fail[next_state] = self.transitions[fail_state].get(char, 0)
+        queue.append(next_state)
+
+  def find_first_and_last(self, code: str) -> Tuple[str, str]:
+    """Finds the first and last digit tokens in a line, as digits"""
+    transitions = self.transitions
+    outputs = self.outputs
+    first_start = last_start = -1
+    first_digit = last_digit = None
+
+    state = 0
+    for idx, char in enumerate(code):
+      state = transitions[state].get(char, 0)
+      for length, digit in outputs[state]:
+        start = idx - length + 1
+        if first_digit is None or start < first_start:
+          first_start, first_digit = start, digit
+        if start > last_start:
+          last_start, last_digit = start, digit
+
+    if first_digit is None:
+      raise ValueError(f'No digits found in code: {code}')
+
+    return (first_digit, last_digit)
+
+  def match_at(self, code: str, idx: int) -> Optional[str]:
+    """Returns the digit of the token starting at the given index of the code, if there is one"""
+    trie = self.trie
+    token_digits = self.token_digits
+    state = 0
+    for char_idx in range(idx, len(code)):
+      state = trie[state].get(code[char_idx])
+      if state is None:
+        return None
+      if token_digits[state] is not None:
+        return token_digits[state]
+    return None
+
+  def find_first(self, code: str) -> str:
+    """Scans forward from the start of the code until a digit token is found"""
+    for idx in range(len(code)):
+      digit = self.match_at(code, idx)
+      if digit is not None:
+        return digit
+    raise ValueError(f'No digits found in code: {code}')
+
+  def find_last(self, code: str) -> str:
+    """Scans backward from the end of the code until a digit token is found"""
+    for idx in range(len(code) - 1, -1, -1):
+      digit = self.match_at(code, idx)
+      if digit is not None:
+        return digit
+    raise ValueError(f'No digits found in code: {code}')
+
+number_scanner = NumberScanner(number_words)
+
+def get_calibration_value(code: str, mode: ExtractionMode = 'bidirectional', scanner: NumberScanner = number_scanner) -> int:
+  """Combines the first and last digit as strings, then converts them to a number"""
+  if mode == 'scan':
+    first_digit, last_digit = scanner.find_first_and_last(code)
+  else:
+    first_digit = scanner.find_first(code)
+    last_digit = scanner.find_last(code)
+  return int(first_digit + last_digit)
+
+def read_codes(file: TextIO) -> Iterator[str]:
+  """Streams codes out of a file one line at a time, skipping blank lines"""
+  for line in file:
+    code = line.strip()
+    if code:
+      yield code
+
+def sum_calibration_values(codes: Iterable[str], mode: ExtractionMode = 'bidirectional', scanner: NumberScanner = number_scanner) -> int:
+  total_value = 0
+  for code in codes:
+    total_value += get_calibration_value(code, mode, scanner)
 
-def word_to_digit(word):
-  return number_words[word] if word in number_words else word
+  return total_value
 
-import re
+def parse_custom_token(text: str) -> Tuple[str, str]:
+  """Parses a custom token given as `word=digit`"""
+  word, _, digit = text.partition('=')
+  if not word or not digit:
+    raise argparse.ArgumentTypeError(f'Custom tokens must look like word=digit, not {text}')
+  return (word, digit)
 
-total_value = 0
-for code in codes:
-  result = re.search(f'(?P<first_num>\d|{number_words_regex})(.*(?P<last_num>\d|{number_words_regex}))?', code)
-  match_groups = result.groupdict()
-  first_num = match_groups.get('first_num')
-  last_num = match_groups.get('last_num') or first_num
+def main():
+  """Sums the calibration values from the given file, or from stdin if it is `-`"""
+  parser = argparse.ArgumentParser()
+  parser.add_argument('path', nargs='?', default='resources/day_1_values.txt')
+  parser.add_argument('--language', action='append', choices=number_vocabularies.keys(), help='number words to recognize (default: en)')
+  parser.add_argument('--token', action='append', type=parse_custom_token, default=[], help='extra token to recognize, as word=digit')
+  args = parser.parse_args()
 
-  # Combine the first and last digit as strings, then convert to a number and add to the total value
-  first_digit = word_to_digit(first_num)
-  last_digit = word_to_digit(last_num)
-  # print(f'{code}\n  ->{result.groupdict()}\n  -> first_digit: {first_digit}, last_digit: {last_digit}')
-  combined_value = int(first_digit + last_digit)
-  total_value += combined_value
+  vocabulary = build_vocabulary(args.language or ['en'], dict(args.token))
+  scanner = NumberScanner(vocabulary)
+  if args.path == '-':
+    total_value = sum_calibration_values(read_codes(sys.stdin), scanner=scanner)
+  else:
+    with open(args.path, encoding='utf-8') as file:
+      total_value = sum_calibration_values(read_codes(file), scanner=scanner)
 
-print(total_value)
+  print(total_value)
 
+if __name__ == '__main__':
+  main()
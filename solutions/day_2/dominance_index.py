@@ -0,0 +1,102 @@
+"""Day 2 - Dominance index for counting the games that fit in a cube bag"""
+from typing import Dict, List, Sequence, Tuple
+
+
+class DominanceIndex:
+    """A k-d tree over per-game maximum vectors, for finding the games whose every count fits
+    under a cube bag without scanning all of them.
+
+    Games with identical vectors are merged first, and every node keeps the bounding box, game
+    count and game number sum of its subtree. A query adds whole subtrees whose box fits under
+    the bag, skips subtrees whose box can't fit, and only descends into the rest. Vectors can
+    have any number of colors, as long as bags use the same color order.
+    """
+    leaf_size = 8
+
+    def __init__(self, game_nums: Sequence[int], maxima: Sequence[Sequence[int]]):
+        # Merge games with the same vector, since counts are small and repeat often
+        merged: Dict[Tuple[int, ...], List[int]] = {}
+        for game_num, vector in zip(game_nums, maxima):
+            totals = merged.setdefault(tuple(vector), [0, 0])
+            totals[0] += 1
+            totals[1] += game_num
+
+        self.dimensions = len(next(iter(merged))) if merged else 0
+        self.points = list(merged.keys())
+        self.point_counts = [ totals[0] for totals in merged.values() ]
+        self.point_sums = [ totals[1] for totals in merged.values() ]
+
+        self.node_lows: List[Tuple[int, ...]] = []
+        self.node_highs: List[Tuple[int, ...]] = []
+        self.node_counts: List[int] = []
+        self.node_sums: List[int] = []
+        self.node_children: List[Tuple[int, int] | None] = []
+        self.node_ranges: List[Tuple[int, int]] = []
+        if self.points:
+            order = list(range(len(self.points)))
+            self.__build(order)
+            # Reorder point data so each leaf covers a contiguous range
+            self.points = [ self.points[idx] for idx in order ]
+            self.point_counts = [ self.point_counts[idx] for idx in order ]
+            self.point_sums = [ self.point_sums[idx] for idx in order ]
+
+    def __build(self, order: List[int]) -> None:
+        """Builds the tree iteratively, sorting slices of `order` in place as nodes are split"""
+        self.__add_node(order, 0, len(order))
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            start, end = self.node_ranges[node]
+            if end - start <= self.leaf_size:
+                continue
+
+            # Split on the median of the color with the widest spread
+            low, high = self.node_lows[node], self.node_highs[node]
+            axis = max(range(self.dimensions), key=lambda dim: high[dim] - low[dim])
+            if high[axis] == low[axis]:
+                continue
+            order[start:end] = sorted(order[start:end], key=lambda idx: self.points[idx][axis])
+            mid = (start + end) // 2
+
+            left = self.__add_node(order, start, mid)
+            right = self.__add_node(order, mid, end)
+            self.node_children[node] = (left, right)
+            stack.extend((left, right))
+
+    def __add_node(self, order: List[int], start: int, end: int) -> int:
+        points = [ self.points[idx] for idx in order[start:end] ]
+        self.node_lows.append(tuple(map(min, zip(*points))))
+        self.node_highs.append(tuple(map(max, zip(*points))))
+        self.node_counts.append(sum(self.point_counts[idx] for idx in order[start:end]))
+        self.node_sums.append(sum(self.point_sums[idx] for idx in order[start:end]))
+        self.node_children.append(None)
+        self.node_ranges.append((start, end))
+        return len(self.node_ranges) - 1
+
+    def query(self, cube_bag: Sequence[int]) -> Tuple[int, int]:
+        """Returns the number of games, and the sum of their game numbers, whose every color count
+        is at most the count of that color in the bag
+        """
+        if len(cube_bag) != self.dimensions and self.points:
+            raise ValueError(f'Expected a bag with {self.dimensions} colors, got {len(cube_bag)}')
+
+        game_count = 0
+        game_num_sum = 0
+        stack = [0] if self.points else []
+        while stack:
+            node = stack.pop()
+            if all(high <= count for high, count in zip(self.node_highs[node], cube_bag)):
+                game_count += self.node_counts[node]
+                game_num_sum += self.node_sums[node]
+            elif any(low > count for low, count in zip(self.node_lows[node], cube_bag)):
+                continue
+            elif self.node_children[node] is not None:
+                stack.extend(self.node_children[node])
+            else:
+                start, end = self.node_ranges[node]
+                for idx in range(start, end):
+                    if all(value <= count for value, count in zip(self.points[idx], cube_bag)):
+                        game_count += self.point_counts[idx]
+                        game_num_sum += self.point_sums[idx]
+
+        return (game_count, game_num_sum)
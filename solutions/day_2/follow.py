@@ -0,0 +1,139 @@
+"""Day 2 - Incremental aggregator for a game log that keeps growing"""
+import argparse
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Mapping
+
+from solutions.day_2.part_1 import check_if_maxima_valid
+from solutions.day_2.part_2 import cube_bag_power
+from solutions.day_2.records import ColorSchema, CubeColor, CubeVector, default_colors, parse_game_maxima
+
+
+@dataclass
+class Checkpoint:
+    """How far into the log has been aggregated, and the running totals up to that point"""
+    offset: int = 0
+    inode: int = 0
+    device: int = 0
+    """Which file the offset points into, so a rotated log is noticed even when it's no shorter"""
+    game_id_total: int = 0
+    total_cube_power: int = 0
+    cube_bag: Dict[CubeColor, int] = field(default_factory=dict)
+    colors: List[CubeColor] = field(default_factory=lambda: list(default_colors))
+
+
+class GameLogAggregator:
+    """Keeps the part 1 and part 2 totals of a game log up to date, reading only the lines
+    appended since the last pass. Partial lines at the end of the log are left for the next pass.
+    """
+    read_size = 1 << 20
+
+    def __init__(self, log_path: str, checkpoint_path: str | None = None, cube_bag: Mapping[CubeColor, int] | None = None):
+        self.log_path = log_path
+        self.checkpoint_path = checkpoint_path
+        cube_bag = dict(cube_bag if cube_bag is not None else { "red": 12, "green": 13, "blue": 14 })
+
+        self.checkpoint = self.__load_checkpoint()
+        if self.checkpoint.cube_bag != cube_bag:
+            # The totals were counted against another bag, so they have to be recounted
+            self.checkpoint = Checkpoint(cube_bag=cube_bag)
+        self.schema = ColorSchema(self.checkpoint.colors)
+
+    def __load_checkpoint(self) -> Checkpoint:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return Checkpoint()
+        with open(self.checkpoint_path, encoding="utf-8") as checkpoint_file:
+            return Checkpoint(**json.load(checkpoint_file))
+
+    def save_checkpoint(self) -> None:
+        """Writes the checkpoint to a temporary file first, so a crash never leaves a torn checkpoint"""
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint.colors = list(self.schema.colors)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as checkpoint_file:
+            json.dump(asdict(self.checkpoint), checkpoint_file)
+        os.replace(temp_path, self.checkpoint_path)
+
+    def __bag_vector(self) -> CubeVector:
+        """Converts the cube bag to a vector over the colors seen so far. Colors the log hasn't
+        used yet are left out rather than added to the schema, since no game pulled any of them.
+        """
+        indices = self.schema.indices
+        cube_bag = [0] * len(self.schema)
+        for color, count in self.checkpoint.cube_bag.items():
+            if color in indices:
+                cube_bag[indices[color]] = count
+        return cube_bag
+
+    def process_new_lines(self) -> int:
+        """Aggregates every complete line appended since the last pass, returning how many games were added"""
+        try:
+            log_file = open(self.log_path, "rb")
+        except FileNotFoundError:
+            # The log hasn't been created yet, or is being rotated, so try again on the next pass
+            return 0
+
+        with log_file:
+            checkpoint = self.checkpoint
+            log_stat = os.fstat(log_file.fileno())
+            if (log_stat.st_ino, log_stat.st_dev) != (checkpoint.inode, checkpoint.device) or log_stat.st_size < checkpoint.offset:
+                # The log was truncated or replaced, so start over
+                self.checkpoint = checkpoint = Checkpoint(inode=log_stat.st_ino, device=log_stat.st_dev, cube_bag=checkpoint.cube_bag)
+                self.schema = ColorSchema(checkpoint.colors)
+
+            cube_bag = self.__bag_vector()
+            game_count = 0
+            log_file.seek(checkpoint.offset)
+            pending = b""
+            while chunk := log_file.read(self.read_size):
+                pending += chunk
+                complete_end = pending.rfind(b"\n") + 1
+                for line in pending[:complete_end].decode("utf-8").splitlines():
+                    if not line.strip():
+                        continue
+                    color_count = len(self.schema)
+                    game_num, maxima = parse_game_maxima(line, self.schema)
+                    if len(self.schema) > color_count:
+                        # None of the earlier games had the new color, so their powers all drop to 0
+                        checkpoint.total_cube_power = 0
+                        cube_bag = self.__bag_vector()
+                    if check_if_maxima_valid(maxima, cube_bag):
+                        checkpoint.game_id_total += game_num
+                    checkpoint.total_cube_power += cube_bag_power(maxima, self.schema)
+                    game_count += 1
+                checkpoint.offset += complete_end
+                pending = pending[complete_end:]
+
+        return game_count
+
+    def follow(self, poll_interval: float = 1.0) -> None:
+        """Polls the log for new lines forever, checkpointing and reporting after each batch"""
+        while True:
+            if self.process_new_lines():
+                self.save_checkpoint()
+                print(f"Game ID total: {self.checkpoint.game_id_total}, total cube power: {self.checkpoint.total_cube_power}")
+            time.sleep(poll_interval)
+
+
+def main() -> None:
+    """Main"""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", nargs="?", default="resources/day_2_values.txt")
+    parser.add_argument("--checkpoint", help="file to persist progress in between runs")
+    parser.add_argument("--follow", action="store_true", help="keep polling the log for appended games")
+    parser.add_argument("--interval", type=float, default=1.0, help="seconds between polls when following")
+    args = parser.parse_args()
+
+    aggregator = GameLogAggregator(args.path, args.checkpoint)
+    if args.follow:
+        aggregator.follow(args.interval)
+    else:
+        aggregator.process_new_lines()
+        aggregator.save_checkpoint()
+        print(f"Game ID total: {aggregator.checkpoint.game_id_total}, total cube power: {aggregator.checkpoint.total_cube_power}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Day 2 - Columnar game store for checking many cube bags at once"""
+from io import TextIOWrapper
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from solutions.day_2.dominance_index import DominanceIndex
+from solutions.day_2.records import ColorSchema, CubeColor, GameTable, default_colors, parse_game_maxima
+
+
+class GameStore:
+    """The game numbers and per-color maximum pulls of every game, held column-wise so that
+    candidate cube bags can be checked against all games in one vectorized call. There is one
+    maxima column per color in the schema.
+    """
+    max_chunk_cells = 1 << 24
+    """Upper bound on the (bags x games) comparisons made at once, to keep memory bounded"""
+
+    def __init__(self, schema: ColorSchema, game_nums: np.ndarray, maxima: np.ndarray):
+        self.schema = schema
+        self.game_nums = game_nums
+        self.maxima = maxima
+
+    @staticmethod
+    def from_file(file: TextIOWrapper, schema: ColorSchema | None = None) -> 'GameStore':
+        """Loads every game in a file, widening the schema with any colors discovered along the way"""
+        schema = schema if schema is not None else ColorSchema()
+        game_table = GameTable(schema)
+        for line in file:
+            if line.strip():
+                game_table.append(*parse_game_maxima(line, schema))
+
+        return GameStore.from_game_table(game_table)
+
+    @staticmethod
+    def from_game_table(game_table: GameTable) -> 'GameStore':
+        game_table.widen()
+        return GameStore(
+            game_table.schema,
+            np.frombuffer(game_table.game_nums, dtype=np.uint32).astype(np.int64),
+            np.frombuffer(game_table.maxima, dtype=np.uint32).astype(np.int64).reshape(-1, game_table.width),
+        )
+
+    def bags_to_array(self, cube_bags: Sequence[Mapping[CubeColor, int]]) -> np.ndarray:
+        """Converts cube bags keyed by color to rows of counts, in the same color order as the store.
+        Colors the store has never seen are ignored, since no game pulled any of them.
+        """
+        indices = self.schema.indices
+        bags = np.zeros((len(cube_bags), len(self.schema)), dtype=np.int64)
+        for row, cube_bag in enumerate(cube_bags):
+            for color, count in cube_bag.items():
+                if color in indices:
+                    bags[row, indices[color]] = count
+        return bags
+
+    def valid_game_num_sums(self, cube_bags: Sequence[Mapping[CubeColor, int]] | np.ndarray) -> np.ndarray:
+        """Sums the numbers of the games that are valid for each of the given cube bags.
+        Bags can be given keyed by color, or as an array with one row of color counts per bag.
+        """
+        bags = cube_bags if isinstance(cube_bags, np.ndarray) else self.bags_to_array(cube_bags)
+        sums = np.empty(len(bags), dtype=np.int64)
+        chunk_size = max(1, self.max_chunk_cells // max(1, len(self.game_nums)))
+
+        for start in range(0, len(bags), chunk_size):
+            chunk = bags[start:start + chunk_size]
+            valid = (self.maxima[np.newaxis, :, :] <= chunk[:, np.newaxis, :]).all(axis=2)
+            sums[start:start + len(chunk)] = valid.astype(np.int64) @ self.game_nums
+
+        return sums
+
+    def dominance_index(self) -> DominanceIndex:
+        """Builds an index for answering single bag queries faster than a scan of every game"""
+        return DominanceIndex(self.game_nums.tolist(), self.maxima.tolist())
+
+
+def main() -> None:
+    """Main"""
+    with open("resources/day_2_values.txt", encoding="utf-8") as input_data:
+        game_store = GameStore.from_file(input_data, ColorSchema(default_colors))
+
+    cube_bags = [ { "red": count, "green": count + 1, "blue": count + 2 } for count in range(8, 20) ]
+    for cube_bag, game_id_total in zip(cube_bags, game_store.valid_game_num_sums(cube_bags)):
+        print(cube_bag, game_id_total)
+
+if __name__ == "__main__":
+    main()
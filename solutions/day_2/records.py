@@ -0,0 +1,185 @@
+"""Day 2 - Compact records and input parsing shared by both parts"""
+import re
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple
+
+CubeColor = str
+"""A cube color, as discovered from the input"""
+
+CubeVector = List[int]
+"""Cube counts indexed by color, in the order the colors were interned in a ColorSchema.
+Colors past the end of a vector have a count of 0.
+"""
+
+RoundResult = CubeVector
+"""Cube pull results from a round of the game"""
+
+CubeBag = CubeVector
+"""A bag of cubes and the count of each color"""
+
+default_colors: List[CubeColor] = ["red", "green", "blue"]
+
+
+class ColorSchema:
+    """Interns cube colors to vector indices as they are discovered in the input"""
+    __slots__ = ("colors", "indices")
+
+    def __init__(self, colors: Iterable[CubeColor] = ()):
+        self.colors: List[CubeColor] = []
+        self.indices: Dict[CubeColor, int] = {}
+        for color in colors:
+            self.intern(color)
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    def intern(self, color: CubeColor) -> int:
+        """Gets the vector index of a color, adding it to the schema if it hasn't been seen yet"""
+        idx = self.indices.get(color)
+        if idx is None:
+            idx = len(self.colors)
+            self.indices[color] = idx
+            self.colors.append(color)
+        return idx
+
+    def vector(self, counts: Mapping[CubeColor, int]) -> CubeVector:
+        """Converts counts keyed by color to a vector as wide as the schema"""
+        vector = [0] * len(self.colors)
+        for color, count in counts.items():
+            idx = self.intern(color)
+            if idx >= len(vector):
+                vector.append(0)
+            vector[idx] = count
+        return vector
+
+    def pad(self, vector: CubeVector) -> CubeVector:
+        """Widens a vector parsed before newer colors were discovered"""
+        return vector + [0] * (len(self.colors) - len(vector))
+
+    def to_dict(self, vector: CubeVector) -> Dict[CubeColor, int]:
+        return dict(zip(self.colors, self.pad(vector)))
+
+
+class GameResult:
+    """Results from a single game"""
+    __slots__ = ("game_num", "round_results")
+
+    def __init__(self, game_num: int, round_results: List[RoundResult]):
+        self.game_num = game_num
+        self.round_results = round_results
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameResult):
+            return NotImplemented
+        return (self.game_num, self.round_results) == (other.game_num, other.round_results)
+
+    def __repr__(self) -> str:
+        return f"GameResult(game_num={self.game_num!r}, round_results={self.round_results!r})"
+
+
+class GameRecord:
+    """A game reduced to its number and the highest count of each color pulled in it"""
+    __slots__ = ("game_num", "maxima")
+
+    def __init__(self, game_num: int, maxima: Tuple[int, ...]):
+        self.game_num = game_num
+        self.maxima = maxima
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, GameRecord):
+            return NotImplemented
+        return (self.game_num, self.maxima) == (other.game_num, other.maxima)
+
+    def __repr__(self) -> str:
+        return f"GameRecord(game_num={self.game_num!r}, maxima={self.maxima!r})"
+
+
+def parse_round_result(round_result: str, schema: ColorSchema) -> RoundResult:
+    """Parses out the results of cube pulls from a single round of the game"""
+    round_regex = r"(?P<count>\d+) (?P<color>\w+)"
+    vector = [0] * len(schema)
+    for match in re.finditer(round_regex, round_result):
+        idx = schema.intern(match.group("color"))
+        if idx >= len(vector):
+            vector.extend([0] * (idx + 1 - len(vector)))
+        vector[idx] = int(match.group("count"))
+    return vector
+
+def parse_game_results(line: str, schema: ColorSchema) -> GameResult:
+    """Parses out data from an input line"""
+    game_regex = r"Game (\d+):"
+    game_num = int(re.search(game_regex, line).groups()[0])
+    game_result_str = re.split(r"Game \d+:", line)[1].strip()
+
+    round_results: List[RoundResult] = [
+        parse_round_result(round, schema) for round in re.split('; ', game_result_str)
+    ]
+
+    return GameResult(game_num, round_results)
+
+def parse_game_maxima(line: str, schema: ColorSchema) -> Tuple[int, CubeVector]:
+    """Parses an input line straight to the game number and the highest count of each color
+    pulled in any round, in a single pass over its tokens and without building round results.
+    This is also the minimum necessary number of cubes for the game to be valid.
+    """
+    tokens = line.split()
+    game_num = int(tokens[1].rstrip(":"))
+    indices = schema.indices
+    maxima = [0] * len(schema)
+    for idx in range(2, len(tokens) - 1, 2):
+        count = int(tokens[idx])
+        color = tokens[idx + 1].rstrip(",;")
+        color_idx = indices.get(color)
+        if color_idx is None:
+            color_idx = schema.intern(color)
+            maxima.append(0)
+        if count > maxima[color_idx]:
+            maxima[color_idx] = count
+
+    return (game_num, maxima)
+
+
+class GameTable:
+    """Game records packed column-wise into typed arrays, at 4 bytes for the game number
+    plus 4 bytes per color, with no per-game Python objects.
+    Records are only materialized when they are read back out.
+    """
+    __slots__ = ("schema", "width", "game_nums", "maxima")
+
+    def __init__(self, schema: ColorSchema):
+        self.schema = schema
+        self.width = len(schema)
+        self.game_nums = array("I")
+        self.maxima = array("I")
+
+    def __len__(self) -> int:
+        return len(self.game_nums)
+
+    def __getitem__(self, idx: int) -> GameRecord:
+        start = idx * self.width
+        return GameRecord(self.game_nums[idx], tuple(self.maxima[start:start + self.width]))
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        for idx in range(len(self.game_nums)):
+            yield self[idx]
+
+    def append(self, game_num: int, maxima: CubeVector) -> None:
+        self.widen()
+        self.game_nums.append(game_num)
+        self.maxima.extend(maxima)
+        self.maxima.extend([0] * (self.width - len(maxima)))
+
+    def widen(self) -> None:
+        """Re-lays out the maxima for any newly discovered colors, which should be rare"""
+        new_width = len(self.schema)
+        if new_width == self.width:
+            return
+        widened = array("I", bytes(len(self.game_nums) * new_width * self.maxima.itemsize))
+        for idx in range(len(self.game_nums)):
+            widened[idx * new_width:idx * new_width + self.width] = self.maxima[idx * self.width:(idx + 1) * self.width]
+        self.maxima = widened
+        self.width = new_width
+
+    def nbytes(self) -> int:
+        """The size of the packed game data, not counting the fixed overhead of the arrays"""
+        return len(self.game_nums) * self.game_nums.itemsize + len(self.maxima) * self.maxima.itemsize
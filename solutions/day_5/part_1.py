@@ -1,11 +1,25 @@
 """Day 5 part 1"""
 
 import re
-from typing import List, Self, Dict
+import sys
+import mmap
+import struct
+from array import array
+from typing import BinaryIO, Iterable, Iterator, List, Literal, Self, Dict, Sequence, Tuple
+from collections import OrderedDict, deque
 from dataclasses import dataclass
 from io import TextIOWrapper
 from pprint import pprint, pformat
-from math import floor
+from bisect import bisect_right
+from operator import attrgetter
+
+IdRange = Tuple[int, int]
+"""A range of IDs as (start, length)"""
+
+OverlapPolicy = Literal['error', 'first', 'last']
+"""How to handle ranges of a map whose sources overlap: raise an error, or let the range that
+comes first (or last) in the input win, trimming the others down to what's left over
+"""
 
 @dataclass
 class IdMap:
@@ -41,80 +55,609 @@ class IdMap:
         return IdMap(int(source_range_start), int(target_range_start), int(range_length))
 
 
+@dataclass
+class MapReport:
+    """Diagnostics for the source ranges of a single map"""
+    map_key: str
+    range_count: int
+    overlaps: List[Tuple[IdMap, IdMap]]
+    """Pairs of ranges whose sources overlap. Every range that overlaps an earlier-starting one
+    is paired with the one reaching furthest, so each overlapping range shows up at least once.
+    """
+    gaps: List[IdRange]
+    """Source values between the lowest and highest covered ones that no range covers"""
+    covered_length: int
+    """How many source values are covered by at least one range"""
+    span: IdRange
+    """From the lowest covered source value to the highest"""
+
+    @property
+    def coverage(self) -> float:
+        """The share of the span covered by ranges"""
+        return self.covered_length / self.span[1] if self.span[1] else 0.0
+
+    @staticmethod
+    def from_id_maps(map_key: str, sorted_maps: List[IdMap]) -> 'MapReport':
+        """Builds the report in a single sweep over ranges sorted by source start"""
+        overlaps: List[Tuple[IdMap, IdMap]] = []
+        gaps: List[IdRange] = []
+        covered_length = 0
+        reaching_map: IdMap | None = None
+        reach = 0
+        for id_map in sorted_maps:
+            map_start = id_map.source_range_start
+            map_end = map_start + id_map.range_length
+            if reaching_map is not None and map_start < reach:
+                overlaps.append((reaching_map, id_map))
+            elif reaching_map is not None and map_start > reach:
+                gaps.append((reach, map_start - reach))
+            covered_length += max(0, map_end - max(map_start, reach if reaching_map is not None else map_start))
+            if reaching_map is None or map_end > reach:
+                reaching_map, reach = id_map, map_end
+
+        span_start = sorted_maps[0].source_range_start if sorted_maps else 0
+        return MapReport(map_key, len(sorted_maps), overlaps, gaps, covered_length, (span_start, reach - span_start))
+
+
+def resolve_overlaps(id_maps: List[IdMap], overlap_policy: OverlapPolicy) -> List[IdMap]:
+    """Trims ranges so that no two overlap, with the first (or last) range in the given order
+    winning wherever they do. Claimed source values are kept as a sorted list of disjoint
+    intervals, so each range only has to be checked against its neighbours in that list.
+    """
+    prioritized_maps = id_maps if overlap_policy == 'first' else id_maps[::-1]
+    claimed_starts: List[int] = []
+    claimed_ends: List[int] = []
+    resolved_maps: List[IdMap] = []
+    for id_map in prioritized_maps:
+        map_start = id_map.source_range_start
+        map_end = map_start + id_map.range_length
+        offset = id_map.target_range_start - map_start
+
+        # Walk the claimed intervals that could touch this range, keeping what's left between them
+        idx = max(bisect_right(claimed_starts, map_start) - 1, 0)
+        curr_value = map_start
+        while curr_value < map_end:
+            if idx < len(claimed_starts) and claimed_ends[idx] <= curr_value:
+                idx += 1
+            elif idx < len(claimed_starts) and claimed_starts[idx] <= curr_value:
+                curr_value = claimed_ends[idx]
+                idx += 1
+            else:
+                piece_end = min(map_end, claimed_starts[idx]) if idx < len(claimed_starts) else map_end
+                resolved_maps.append(IdMap(curr_value, curr_value + offset, piece_end - curr_value))
+                claimed_starts.insert(idx, curr_value)
+                claimed_ends.insert(idx, piece_end)
+                curr_value = piece_end
+                idx += 1
+
+    return resolved_maps
+
+
+@dataclass
+class ComposedMap:
+    """A chain of maps collapsed into one piecewise-linear function. Each segment starts at
+    a value in `segment_starts` and runs up to the next one, and values in it are converted
+    by adding the matching offset from `segment_offsets`.
+    """
+    map_keys: List[str]
+    segment_starts: List[int]
+    segment_offsets: List[int]
+
+    def convert_value(self, num: int) -> int:
+        """Converts a value through the whole chain with a single binary search"""
+        segment_idx = bisect_right(self.segment_starts, num) - 1
+        return num + self.segment_offsets[segment_idx] if segment_idx >= 0 else num
+
+    def convert_sorted_values(self, values: Iterable[int]) -> Iterator[int]:
+        """Converts a stream of values given in ascending order by sweeping through the segments
+        alongside it, so each value costs amortized constant time instead of a binary search
+        """
+        segment_starts = self.segment_starts
+        segment_offsets = self.segment_offsets
+        segment_idx = -1
+        prev_value: int | None = None
+        for value in values:
+            if prev_value is not None and value < prev_value:
+                raise ValueError(f'Values must be sorted, but {value} came after {prev_value}')
+            prev_value = value
+            while segment_idx + 1 < len(segment_starts) and segment_starts[segment_idx + 1] <= value:
+                segment_idx += 1
+            yield value + segment_offsets[segment_idx] if segment_idx >= 0 else value
+
+    def segments(self) -> Iterator[Tuple[int, int | None, int]]:
+        """Yields each segment as (start, end, offset), where the last segment has no end"""
+        for idx, (segment_start, offset) in enumerate(zip(self.segment_starts, self.segment_offsets)):
+            segment_end = self.segment_starts[idx + 1] if idx + 1 < len(self.segment_starts) else None
+            yield (segment_start, segment_end, offset)
+
+    def invert_range(self, target_range: IdRange) -> List[IdRange]:
+        """Finds the ranges of source values that convert to a value in the given target range"""
+        target_start, target_length = target_range
+        target_end = target_start + target_length
+        source_ranges: List[IdRange] = []
+        for segment_start, segment_end, offset in self.segments():
+            overlap_start = max(target_start, segment_start + offset)
+            overlap_end = target_end if segment_end is None else min(target_end, segment_end + offset)
+            if overlap_start < overlap_end:
+                source_ranges.append((overlap_start - offset, overlap_end - overlap_start))
+        return merge_ranges(source_ranges)
+
+    def convert_values_batch(self, values: 'np.ndarray') -> 'np.ndarray':
+        """Converts a whole NumPy array of values at once, finding every value's segment with `np.searchsorted`"""
+        import numpy as np # Only needed for batch conversion
+
+        curr_values = np.asarray(values, dtype=np.int64)
+        segment_starts = np.array(self.segment_starts, dtype=np.int64)
+        # Shifted by one so that values before the first segment (index 0) pass through as-is
+        offsets = np.array([0, *self.segment_offsets], dtype=np.int64)
+        segment_idxs = np.searchsorted(segment_starts, curr_values, side='right')
+        return curr_values + offsets.take(segment_idxs)
+
+
+@dataclass
+class MapArrays:
+    """A map's ranges as parallel arrays sorted by source start, so they can be searched with bisect.
+    Values from `starts[idx]` up to (but not including) `ends[idx]` are converted by adding `offsets[idx]`.
+    """
+    starts: Sequence[int]
+    ends: Sequence[int]
+    offsets: Sequence[int]
+
+    @staticmethod
+    def from_id_maps(id_maps: List[IdMap]) -> 'MapArrays':
+        """Builds the arrays from maps that are already sorted by source start"""
+        return MapArrays(
+            [ id_map.source_range_start for id_map in id_maps ],
+            [ id_map.source_range_start + id_map.range_length for id_map in id_maps ],
+            [ id_map.target_range_start - id_map.source_range_start for id_map in id_maps ],
+        )
+
+    def to_id_maps(self) -> List[IdMap]:
+        return [
+            IdMap(start, start + offset, end - start)
+            for start, end, offset in zip(self.starts, self.ends, self.offsets)
+        ]
+
+    def convert_values_batch(self, values: 'np.ndarray') -> 'np.ndarray':
+        """Converts a whole NumPy array of values through this map, finding every value's range with `np.searchsorted`"""
+        import numpy as np # Only needed for batch conversion
+
+        curr_values = np.asarray(values, dtype=np.int64)
+        if len(self.starts) == 0:
+            return curr_values
+        starts = np.asarray(self.starts, dtype=np.int64)
+        ends = np.asarray(self.ends, dtype=np.int64)
+        offsets = np.asarray(self.offsets, dtype=np.int64)
+        # Values before the first range get index -1, which is masked out along with values in gaps
+        range_idxs = np.searchsorted(starts, curr_values, side='right') - 1
+        in_range = (range_idxs >= 0) & (curr_values < ends.take(range_idxs))
+        return curr_values + np.where(in_range, offsets.take(range_idxs), 0)
+
+
 class IdMapTree:
-    maps: Dict[str, List[IdMap]] = { }
-    map_order = [
-        'seed-to-soil',
-        'soil-to-fertilizer',
-        'fertilizer-to-water',
-        'water-to-light',
-        'light-to-temperature',
-        'temperature-to-humidity',
-        'humidity-to-location',
-    ]
+    maps: Dict[str, List[IdMap]]
+    """The ranges of each map as IdMaps, built from `map_arrays` when first needed"""
+    map_arrays: Dict[str, MapArrays]
+    map_key_regex = re.compile(r'^(?P<source>[\w-]+?)-to-(?P<target>[\w-]+)$')
+    composed_map_cache_size = 32
+    """How many composed maps to keep around for category queries, dropping the least recently used"""
+
+    snapshot_magic = b'IDMT'
+    snapshot_version = 1
+    snapshot_header = struct.Struct('<4sII')
+    """Snapshot header: magic, format version and map count"""
+    snapshot_map_header = struct.Struct('<IQ')
+    """Header of each map in a snapshot: name length and range count"""
+
+    def __init__(self):
+        self.maps = { }
+        self.map_arrays = { }
+        self.map_reports: Dict[str, MapReport] = { }
+        self.__composed_maps: OrderedDict[Tuple[str, str], ComposedMap] = OrderedDict()
+        self.__map_chains: Dict[Tuple[str, str], List[str]] = { }
+        self.__snapshot: mmap.mmap | None = None
 
     @staticmethod
-    def from_file(file: TextIOWrapper) -> Self:
+    def from_file(file: TextIOWrapper, overlap_policy: OverlapPolicy = 'error') -> Self:
+        """Parses an almanac, checking each map for overlapping ranges as it goes.
+        The diagnostics for every map as read are kept in `map_reports`.
+        """
         map_name_regex = r'(?P<map_name>[\w-]+) map:'
         curr_map_name: str or None = None
 
         id_map_tree = IdMapTree()
+        parsed_maps: Dict[str, List[IdMap]] = { }
 
         for line in file:
             map_name_result = re.search(map_name_regex, line)
 
             if map_name_result is not None:
                 curr_map_name = map_name_result.groupdict().get('map_name')
-                id_map_tree.maps[curr_map_name] = []
+                parsed_maps[curr_map_name] = []
             elif curr_map_name is None or not line.strip():
                 pass # Pass if no map name has been seen yet, or if the line is blank
             else:
-                id_map = IdMap.from_text(line)
-                id_map_tree.add_id_map_sorted(curr_map_name, id_map)
+                parsed_maps[curr_map_name].append(IdMap.from_text(line))
+
+        # Sort each map once it has been fully read, rather than inserting in order line by line
+        for map_name, id_maps in parsed_maps.items():
+            id_map_tree.set_id_maps(map_name, id_maps, overlap_policy)
 
         return id_map_tree
 
+    def set_id_maps(self, map_key: str, id_maps: List[IdMap], overlap_policy: OverlapPolicy = 'error') -> None:
+        """Replaces a map with the given ranges, sorting them by source start.
+        Overlapping ranges are handled according to the overlap policy, with 'first' and 'last'
+        referring to the order the ranges were given in.
+        """
+        self.__composed_maps.clear()
+        self.__map_chains.clear()
+        sorted_maps = sorted(id_maps, key=lambda id_map: id_map.source_range_start)
+        map_report = MapReport.from_id_maps(map_key, sorted_maps)
+        self.map_reports[map_key] = map_report
+
+        if map_report.overlaps:
+            if overlap_policy == 'error':
+                first_overlap = ', '.join(map(str, map_report.overlaps[0]))
+                raise ValueError(f'{map_key} has {len(map_report.overlaps)} overlapping ranges, e.g. {first_overlap}')
+            sorted_maps = sorted(resolve_overlaps(id_maps, overlap_policy), key=lambda id_map: id_map.source_range_start)
+        self.maps[map_key] = sorted_maps
+        self.map_arrays[map_key] = MapArrays.from_id_maps(sorted_maps)
+
+    def validate(self) -> Dict[str, MapReport]:
+        """Builds fresh diagnostics for every map as it currently stands"""
+        return { map_key: MapReport.from_id_maps(map_key, self.get_id_maps(map_key)) for map_key in self.map_arrays }
+
+    def get_id_maps(self, map_key: str) -> List[IdMap]:
+        """Gets the ranges of a map as IdMaps, sorted by source start"""
+        if map_key not in self.maps:
+            self.maps[map_key] = self.map_arrays[map_key].to_id_maps()
+        return self.maps[map_key]
+
     def add_id_map_sorted(self, map_key: str, new_map: IdMap) -> None:
-        map_list = self.maps[map_key]
-        for idx, id_map in enumerate(map_list):
-            if new_map.source_range_start < id_map.source_range_start:
-                map_list.insert(idx, new_map)
-                break
-        else:
-            map_list.append(new_map)
+        self.__composed_maps.clear()
+        self.__map_chains.clear()
+        if map_key not in self.map_arrays:
+            self.set_id_maps(map_key, [])
+
+        id_maps = self.get_id_maps(map_key)
+        map_arrays = self.map_arrays[map_key]
+        if not isinstance(map_arrays.starts, list):
+            # Arrays loaded from a snapshot are read-only, so copy them before changing anything
+            map_arrays = self.map_arrays[map_key] = MapArrays(list(map_arrays.starts), list(map_arrays.ends), list(map_arrays.offsets))
 
+        idx = bisect_right(map_arrays.starts, new_map.source_range_start)
+        new_end = new_map.source_range_start + new_map.range_length
+        if (idx > 0 and map_arrays.ends[idx - 1] > new_map.source_range_start) or (idx < len(map_arrays.starts) and map_arrays.starts[idx] < new_end):
+            raise ValueError(f'{new_map} overlaps an existing range in {map_key}')
+        id_maps.insert(idx, new_map)
+        map_arrays.starts.insert(idx, new_map.source_range_start)
+        map_arrays.ends.insert(idx, new_map.source_range_start + new_map.range_length)
+        map_arrays.offsets.insert(idx, new_map.target_range_start - new_map.source_range_start)
 
     def convert_value(self, num: int, map_key: str) -> int:
         """Finds a value in the given map, and coverts it to its corresponding value
         e.g. Takes in a seed value and outputs a soil value
         """
-        map_list = self.maps[map_key].copy()
+        map_arrays = self.map_arrays[map_key]
+        idx = bisect_right(map_arrays.starts, num) - 1
+        if idx >= 0 and num < map_arrays.ends[idx]:
+            return num + map_arrays.offsets[idx]
 
-        while len(map_list) > 0:
-            mid_idx = floor(len(map_list) / 2)
-            curr_map: IdMap = map_list[mid_idx]
-            relative_num_pos = curr_map.compare_to_source(num)
+        return num
 
-            match relative_num_pos:
-                case 0:
-                    return curr_map.convert_source_to_target(num)
-                case 1:
-                    map_list = map_list[(mid_idx + 1) : len(map_list)]
-                    continue
-                case -1:
-                    map_list = map_list[0 : (mid_idx)]
-                    continue
+    def convert_range(self, id_range: IdRange, map_key: str) -> List[IdRange]:
+        """Converts a whole range of values through the given map, splitting it into pieces
+        wherever it crosses the edge of a mapped range. Values that aren't in any mapped range
+        keep their value, same as in `convert_value`.
+        """
+        starts, ends, offsets = attrgetter('starts', 'ends', 'offsets')(self.map_arrays[map_key])
+        range_start, range_length = id_range
+        curr_value = range_start
+        range_end = range_start + range_length
+        converted_ranges: List[IdRange] = []
 
-        return num
+        # Start from the last map beginning at or before the range, which may contain its start
+        map_idx = max(bisect_right(starts, curr_value) - 1, 0)
+
+        while curr_value < range_end:
+            if map_idx < len(starts) and ends[map_idx] <= curr_value:
+                map_idx += 1
+            elif map_idx < len(starts) and starts[map_idx] <= curr_value:
+                piece_end = min(range_end, ends[map_idx])
+                converted_ranges.append((curr_value + offsets[map_idx], piece_end - curr_value))
+                curr_value = piece_end
+                map_idx += 1
+            else:
+                # In a gap before the next map (or past the last one), so values pass through as-is
+                piece_end = min(range_end, starts[map_idx]) if map_idx < len(starts) else range_end
+                converted_ranges.append((curr_value, piece_end - curr_value))
+                curr_value = piece_end
+
+        return converted_ranges
+
+    def convert_ranges(self, id_ranges: List[IdRange], map_key: str) -> List[IdRange]:
+        """Converts ranges of values through the given map, merging any pieces that overlap afterwards"""
+        converted_ranges: List[IdRange] = []
+        for id_range in id_ranges:
+            converted_ranges.extend(self.convert_range(id_range, map_key))
+        return merge_ranges(converted_ranges)
+
+    def find_min_location_from_seed_ranges(self, seed_ranges: List[IdRange]) -> int:
+        """Pushes whole ranges of seeds through every map, so the cost depends on the number of
+        range pieces rather than the number of seeds
+        """
+        curr_ranges = merge_ranges(seed_ranges)
+        for map_key in self.map_order:
+            curr_ranges = self.convert_ranges(curr_ranges, map_key)
+        return min(range_start for range_start, _ in curr_ranges)
+
+    def compose(self, map_keys: List[str] | None = None) -> ComposedMap:
+        """Collapses a chain of maps (by default the whole seed-to-location chain) into a single
+        piecewise-linear function, so a value can be converted through all of them at once
+        """
+        map_keys = self.map_order if map_keys is None else map_keys
+
+        # Past the end of every range, each map passes values through as-is
+        upper_bound = max(
+            (
+                max(end, end + offset)
+                for map_key in map_keys
+                for end, offset in zip(self.map_arrays[map_key].ends, self.map_arrays[map_key].offsets)
+            ),
+            default=0,
+        )
+
+        # Start from the identity, then push each segment's image through the next map
+        segments: List[Tuple[int, int, int]] = [(0, upper_bound, 0)]
+        for map_key in map_keys:
+            next_segments: List[Tuple[int, int, int]] = []
+            for segment_start, segment_end, offset in segments:
+                source_value = segment_start
+                for target_start, piece_length in self.convert_range((segment_start + offset, segment_end - segment_start), map_key):
+                    next_segments.append((source_value, source_value + piece_length, target_start - source_value))
+                    source_value += piece_length
+            segments = next_segments
+
+        # Merge neighbouring segments that ended up with the same offset
+        segment_starts: List[int] = []
+        segment_offsets: List[int] = []
+        for segment_start, _, offset in segments + [(upper_bound, None, 0)]:
+            if not segment_offsets or segment_offsets[-1] != offset:
+                segment_starts.append(segment_start)
+                segment_offsets.append(offset)
+
+        return ComposedMap(list(map_keys), segment_starts, segment_offsets)
+
+    @property
+    def category_graph(self) -> Dict[str, Dict[str, str]]:
+        """Maps each source category to the categories it converts to directly, and the key of
+        the map that does it, as read from `X-to-Y` map names
+        """
+        graph: Dict[str, Dict[str, str]] = { }
+        for map_key in self.map_arrays:
+            map_key_result = self.map_key_regex.match(map_key)
+            if map_key_result is not None:
+                graph.setdefault(map_key_result.group('source'), { })[map_key_result.group('target')] = map_key
+        return graph
+
+    def find_map_chain(self, source: str, target: str) -> List[str]:
+        """Finds the shortest chain of maps converting one category to another, e.g. `soil` to `humidity`"""
+        if (source, target) not in self.__map_chains:
+            self.__map_chains[(source, target)] = self.__search_map_chain(source, target)
+        return list(self.__map_chains[(source, target)])
+
+    def __search_map_chain(self, source: str, target: str) -> List[str]:
+        graph = self.category_graph
+        previous: Dict[str, Tuple[str, str] | None] = { source: None }
+        queue = deque([source])
+        while queue:
+            category = queue.popleft()
+            if category == target:
+                map_chain: List[str] = []
+                while previous[category] is not None:
+                    category, map_key = previous[category]
+                    map_chain.append(map_key)
+                return map_chain[::-1]
+            for next_category, map_key in graph.get(category, { }).items():
+                if next_category not in previous:
+                    previous[next_category] = (category, map_key)
+                    queue.append(next_category)
+
+        raise ValueError(f'No chain of maps converts {source} to {target}')
+
+    @property
+    def map_order(self) -> List[str]:
+        """The chain of maps from seed to location"""
+        return self.find_map_chain('seed', 'location')
+
+    def get_composed_map(self, source: str, target: str) -> ComposedMap:
+        """Gets the composed map from one category to another. The most recently used ones are
+        cached, so repeated queries don't have to find and compose the chain again.
+        """
+        cache_key = (source, target)
+        composed_map = self.__composed_maps.get(cache_key)
+        if composed_map is not None:
+            self.__composed_maps.move_to_end(cache_key)
+            return composed_map
+
+        composed_map = self.compose(self.find_map_chain(source, target))
+        self.__composed_maps[cache_key] = composed_map
+        if len(self.__composed_maps) > self.composed_map_cache_size:
+            self.__composed_maps.popitem(last=False)
+        return composed_map
+
+    def convert_category(self, num: int, source: str, target: str) -> int:
+        """Converts a value from any category to any category reachable from it
+        e.g. Takes in a soil value and outputs a humidity value
+        """
+        return self.get_composed_map(source, target).convert_value(num)
+
+    def get_location_map(self) -> ComposedMap:
+        """Gets the composed seed-to-location chain, building it on first use"""
+        return self.get_composed_map('seed', 'location')
 
     def find_location_from_seed(self, seed: int) -> int:
+        """Converts a seed to its location through the composed seed-to-location chain"""
+        return self.get_location_map().convert_value(seed)
+
+    def convert_value_reverse(self, num: int, map_key: str) -> List[int]:
+        """Finds every value in the given map that converts to the given value
+        e.g. Takes in a soil value and outputs the seed values that lead to it
+        """
+        source_values = [
+            id_map.source_range_start + (num - id_map.target_range_start)
+            for id_map in self.get_id_maps(map_key) if id_map.compare_to_target(num) == 0
+        ]
+        # Values that aren't in any mapped range keep their value, so the value may also map to itself
+        if num not in source_values and self.convert_value(num, map_key) == num:
+            source_values.append(num)
+        return sorted(source_values)
+
+    def find_seed_ranges_from_location_range(self, location_range: IdRange) -> List[IdRange]:
+        """Finds the ranges of seeds that lead to a location in the given range"""
+        return self.get_location_map().invert_range(location_range)
+
+    def find_seeds_from_location(self, location: int) -> List[int]:
+        """Finds every seed that leads to the given location"""
+        return [
+            seed
+            for range_start, range_length in self.find_seed_ranges_from_location_range((location, 1))
+            for seed in range(range_start, range_start + range_length)
+        ]
+
+    def find_lowest_reachable_location(self, seed_ranges: List[IdRange]) -> int:
+        """Finds the lowest location that any of the seed ranges leads to, by walking the
+        composed chain's segments in order of their lowest location and stopping as soon as
+        no later segment could beat the best location found so far
+        """
+        seed_ranges = merge_ranges(seed_ranges)
+        seed_range_starts = [ range_start for range_start, _ in seed_ranges ]
+        segments = sorted(self.get_location_map().segments(), key=lambda segment: segment[0] + segment[2])
+
+        lowest_location: int | None = None
+        for segment_start, segment_end, offset in segments:
+            if lowest_location is not None and segment_start + offset >= lowest_location:
+                break
+
+            # Locations grow with seeds inside a segment, so only the segment's lowest seed matters
+            range_idx = bisect_right(seed_range_starts, segment_start) - 1
+            if range_idx >= 0 and segment_start < sum(seed_ranges[range_idx]):
+                lowest_seed = segment_start
+            elif range_idx + 1 < len(seed_ranges) and (segment_end is None or seed_range_starts[range_idx + 1] < segment_end):
+                lowest_seed = seed_range_starts[range_idx + 1]
+            else:
+                continue
+
+            if lowest_location is None or lowest_seed + offset < lowest_location:
+                lowest_location = lowest_seed + offset
+
+        if lowest_location is None:
+            raise ValueError('No seeds were given')
+        return lowest_location
+
+    def convert_values_batch(self, values: 'np.ndarray', map_keys: List[str] | None = None) -> 'np.ndarray':
+        """Converts a whole NumPy array of values through a chain of maps (by default seed-to-location),
+        one map at a time, with no per-value Python calls
+        """
+        curr_values = values
+        for map_key in (self.map_order if map_keys is None else map_keys):
+            curr_values = self.map_arrays[map_key].convert_values_batch(curr_values)
+        return curr_values
+
+    def convert_values_sweep(self, values: Sequence[int], source: str = 'seed', target: str = 'location') -> List[int]:
+        """Converts many values at once by sorting them a single time, then sweeping them through
+        the composed chain in one merge pass. The results come back in the same order as the values.
+        """
+        sorted_idxs = sorted(range(len(values)), key=values.__getitem__)
+        sorted_values = (values[idx] for idx in sorted_idxs)
+        converted_values = [0] * len(values)
+        for idx, converted_value in zip(sorted_idxs, self.get_composed_map(source, target).convert_sorted_values(sorted_values)):
+            converted_values[idx] = converted_value
+        return converted_values
+
+    def find_location_from_seed_stepwise(self, seed: int) -> int:
+        """Converts a seed to its location by walking through each map in turn"""
         curr_value = seed
         for map_key in self.map_order:
             curr_value = self.convert_value(curr_value, map_key)
         return curr_value
 
+    def save_snapshot(self, file: BinaryIO) -> None:
+        """Writes the maps in a compact binary format that `load_snapshot` can memory-map.
+        Each map's name is followed by its start, end and offset arrays as little-endian int64s,
+        aligned to 8 bytes so they can be used in place.
+        """
+        file.write(self.snapshot_header.pack(self.snapshot_magic, self.snapshot_version, len(self.map_arrays)))
+        position = self.snapshot_header.size
+        for map_key, map_arrays in self.map_arrays.items():
+            name = map_key.encode('utf-8')
+            padding = -(position + self.snapshot_map_header.size + len(name)) % 8
+            file.write(self.snapshot_map_header.pack(len(name), len(map_arrays.starts)) + name + bytes(padding))
+            position += self.snapshot_map_header.size + len(name) + padding
+
+            for values in (map_arrays.starts, map_arrays.ends, map_arrays.offsets):
+                packed = array('q', values)
+                if sys.byteorder != 'little':
+                    packed.byteswap()
+                file.write(packed.tobytes())
+                position += len(packed) * packed.itemsize
+
+    @staticmethod
+    def load_snapshot(path: str) -> Self:
+        """Loads maps written by `save_snapshot`. The file is memory-mapped and the arrays are used in
+        place, so loading doesn't depend on the number of ranges (on little-endian machines).
+        """
+        id_map_tree = IdMapTree()
+        with open(path, 'rb') as file:
+            snapshot = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, map_count = IdMapTree.snapshot_header.unpack_from(snapshot, 0)
+        if magic != IdMapTree.snapshot_magic or version != IdMapTree.snapshot_version:
+            raise ValueError(f'{path} is not a version {IdMapTree.snapshot_version} IdMapTree snapshot')
+
+        position = IdMapTree.snapshot_header.size
+        for _ in range(map_count):
+            name_length, range_count = IdMapTree.snapshot_map_header.unpack_from(snapshot, position)
+            position += IdMapTree.snapshot_map_header.size
+            map_key = bytes(snapshot[position:position + name_length]).decode('utf-8')
+            position += name_length
+            position += -position % 8
+
+            value_arrays: List[Sequence[int]] = []
+            for _ in range(3):
+                values = memoryview(snapshot)[position:position + range_count * 8].cast('q')
+                if sys.byteorder != 'little':
+                    swapped = array('q', values)
+                    swapped.byteswap()
+                    values = list(swapped)
+                value_arrays.append(values)
+                position += range_count * 8
+            id_map_tree.map_arrays[map_key] = MapArrays(*value_arrays)
+
+        id_map_tree.__snapshot = snapshot
+        return id_map_tree
+
     def __repr__(self):
-        return pformat(self.maps)
+        return pformat({ map_key: self.get_id_maps(map_key) for map_key in self.map_arrays })
+
+
+def merge_ranges(id_ranges: List[IdRange]) -> List[IdRange]:
+    """Sorts ranges and merges any that overlap or touch, dropping empty ones"""
+    merged_ranges: List[IdRange] = []
+    for range_start, range_length in sorted(id_ranges):
+        if range_length <= 0:
+            continue
+        if merged_ranges and range_start <= merged_ranges[-1][0] + merged_ranges[-1][1]:
+            last_start, last_length = merged_ranges[-1]
+            merged_ranges[-1] = (last_start, max(last_length, range_start + range_length - last_start))
+        else:
+            merged_ranges.append((range_start, range_length))
+    return merged_ranges
+
+def parse_seed_ranges(seeds: List[int]) -> List[IdRange]:
+    """Reads the seeds line as (start, length) pairs"""
+    return list(zip(seeds[0::2], seeds[1::2]))
 
 
 def main():
@@ -130,5 +673,8 @@ def main():
 
         print(f'Lowest location: {min_location}')
 
+        min_range_location = id_map_tree.find_min_location_from_seed_ranges(parse_seed_ranges(seeds))
+        print(f'Lowest location from seed ranges: {min_range_location}')
+
 if __name__ == "__main__":
     main()
@@ -1,12 +1,26 @@
-from math import floor
+from math import floor, isqrt
 from operator import itemgetter
+from typing import Dict, Iterable, List, TextIO
 
-races = [
-    { "time": 56, "distance": 499 },
-    { "time": 97, "distance": 2210 },
-    { "time": 77, "distance": 1097 },
-    { "time": 93, "distance": 1440 },
-]
+Race = Dict[str, int]
+"""A race as { "time": ..., "distance": ... }, where the distance is the record to beat"""
+
+max_batch_race_time = 6_000_000_000
+"""Largest race time the batch solver takes, so that every distance it checks fits in an int64"""
+
+def parse_races(file: TextIO) -> List[Race]:
+    """Parses the `Time:` and `Distance:` lines of a race sheet, pairing up their columns"""
+    columns: Dict[str, List[int]] = {}
+    for line in file:
+        label, _, values = line.partition(':')
+        if values.strip():
+            columns[label.strip().lower()] = [ int(value) for value in values.split() ]
+
+    times, distances = columns.get('time'), columns.get('distance')
+    if times is None or distances is None or len(times) != len(distances):
+        raise ValueError('Race sheet needs Time and Distance lines with the same number of values')
+
+    return [ { "time": time, "distance": distance } for time, distance in zip(times, distances) ]
 
 def calculate_distance(race_time: int, button_hold_time: int) -> int:
     velocity = button_hold_time
@@ -47,13 +61,83 @@ def calculate_button_hold_times(race_time: int, best_distance: int) -> range:
 
     return range(low_bound, high_bound)
 
+def calculate_button_hold_times_exact(race_time: int, best_distance: int) -> range:
+    """Same as `calculate_button_hold_times`, but solves `hold * (race_time - hold) > best_distance`
+    directly with an integer square root, so it's exact for integers of any size.
+    Like the search, the range's stop is the highest winning time rather than one past it.
+    """
+    # The winning times lie strictly between the roots of hold^2 - race_time * hold + best_distance
+    # When there are no winning times, the range comes out empty (a count of 0)
+    no_wins = range(race_time // 2 + 1, race_time // 2)
+    discriminant = race_time * race_time - 4 * best_distance
+    if discriminant <= 0:
+        return no_wins
+
+    # isqrt rounds down, so the estimate can land a step away from the true bound either way
+    low_bound = max((race_time - isqrt(discriminant)) // 2, 0)
+    while low_bound <= race_time // 2 and calculate_distance(race_time, low_bound) <= best_distance:
+        low_bound += 1
+    while low_bound > 0 and calculate_distance(race_time, low_bound - 1) > best_distance:
+        low_bound -= 1
+
+    # Distances are symmetric around half the race time
+    high_bound = race_time - low_bound
+    if low_bound > high_bound:
+        return no_wins
+    return range(low_bound, high_bound)
+
+def count_winning_times_batch(race_times: Iterable[int], best_distances: Iterable[int]):
+    """Counts the winning hold times of many races at once, as an int64 array.
+    The float square root only gives a first guess at each lower bound, which then gets stepped
+    into place with exact integer checks, so the counts match `calculate_button_hold_times_exact`.
+    """
+    import numpy as np # Only needed for batches
+
+    race_times = np.asarray(race_times, dtype=np.int64)
+    best_distances = np.asarray(best_distances, dtype=np.int64)
+    if race_times.shape != best_distances.shape:
+        raise ValueError('Need exactly one best distance per race time')
+    if race_times.size and (race_times.min() < 0 or race_times.max() > max_batch_race_time):
+        raise ValueError(f'Race times must be between 0 and {max_batch_race_time} to be batched')
+
+    half_times = race_times // 2
+    half_widths = np.sqrt(np.maximum((race_times / 2) ** 2 - best_distances, 0))
+    low_bounds = np.clip(np.floor(race_times / 2 - half_widths), 0, half_times).astype(np.int64)
+
+    while True:
+        losing = (low_bounds <= half_times) & (low_bounds * (race_times - low_bounds) <= best_distances)
+        if not losing.any():
+            break
+        low_bounds += losing
+    while True:
+        winning_below = (low_bounds > 0) & ((low_bounds - 1) * (race_times - low_bounds + 1) > best_distances)
+        if not winning_below.any():
+            break
+        low_bounds -= winning_below
+
+    return np.maximum(race_times - 2 * low_bounds + 1, 0)
+
+def winning_times_product(counts: Iterable[int]) -> int:
+    """Multiplies the winning time counts together as Python ints, pairing them up level by
+    level so that the huge products of big batches don't get built one small factor at a time
+    """
+    factors = [ int(count) for count in counts ]
+    if 0 in factors:
+        return 0
+    while len(factors) > 1:
+        factors = [ factors[idx] * factors[idx + 1] if idx + 1 < len(factors) else factors[idx] for idx in range(0, len(factors), 2) ]
+    return factors[0] if factors else 1
+
 
 def main():
     race_times_product = 1
 
+    with open('resources/day_6_values.txt', encoding='utf-8') as input_data:
+        races = parse_races(input_data)
+
     for race in races:
         time, distance = itemgetter('time', 'distance')(race)
-        time_range = calculate_button_hold_times(time, distance)
+        time_range = calculate_button_hold_times_exact(time, distance)
         time_range_count = time_range.stop - time_range.start + 1
         print(time_range)
         race_times_product *= time_range_count
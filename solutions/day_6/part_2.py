@@ -1,9 +1,24 @@
 from math import floor
 from operator import itemgetter
+from typing import Dict, TextIO
 
-races = [
-    { "time": 56977793, "distance": 499221010971440 },
-]
+from solutions.day_6.part_1 import Race, calculate_button_hold_times_exact
+
+def parse_race(file: TextIO) -> Race:
+    """Parses the `Time:` and `Distance:` lines of a race sheet with bad kerning, where the
+    values on each line are really the digits of a single number
+    """
+    values: Dict[str, int] = {}
+    for line in file:
+        label, _, digits = line.partition(':')
+        digits = ''.join(digits.split())
+        if digits:
+            values[label.strip().lower()] = int(digits)
+
+    if 'time' not in values or 'distance' not in values:
+        raise ValueError('Race sheet needs both a Time and a Distance line')
+
+    return { "time": values['time'], "distance": values['distance'] }
 
 def calculate_distance(race_time: int, button_hold_time: int) -> int:
     velocity = button_hold_time
@@ -49,9 +64,12 @@ def calculate_button_hold_times(race_time: int, best_distance: int) -> range:
 def main():
     race_times_product = 1
 
+    with open('resources/day_6_values.txt', encoding='utf-8') as input_data:
+        races = [ parse_race(input_data) ]
+
     for race in races:
         time, distance = itemgetter('time', 'distance')(race)
-        time_range = calculate_button_hold_times(time, distance)
+        time_range = calculate_button_hold_times_exact(time, distance)
         time_range_count = time_range.stop - time_range.start + 1
         print(time_range)
         race_times_product *= time_range_count
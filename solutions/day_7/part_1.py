@@ -1,18 +1,19 @@
 from typing import List
 from io import TextIOWrapper
 from dataclasses import dataclass
-import re
 from operator import attrgetter
 from pprint import pprint
 
-type_matchers = [
-    (r'(\w)\1{4}', '5oK'),
-    (r'(\w)\1{3}', '4oK'),
-    (r'(\w)\1{1}(\w)\2{2}|(\w)\3{2}(\w)\4{1}', 'FH'),
-    (r'(\w)\1{2}', '3oK'),
-    (r'(\w)\1{1}.*(\w)\2{1}', '2P'),
-    (r'(\w)\1{1}', '1P'),
-]
+hand_types = {
+    (5,): (6, '5oK'),
+    (4, 1): (5, '4oK'),
+    (3, 2): (4, 'FH'),
+    (3, 1, 1): (3, '3oK'),
+    (2, 2, 1): (2, '2P'),
+    (2, 1, 1, 1): (1, '1P'),
+    (1, 1, 1, 1, 1): (0, 'HC'),
+}
+"""Hand strength and type key for each signature: how many of each card there are, most first"""
 
 card_to_value_map = {
     card:idx for idx, card in enumerate(['2', '3', '4', '5', '6', '7', '8', '9', 'T', 'J', 'Q', 'K', 'A'])
@@ -24,41 +25,40 @@ class HandResult:
     hand_strength: int
     hand_type_key: str
     bid: int
+    sort_key: int
 
 
 def get_hand_type(hand: str) -> (int, str):
     """Gets the hand type as an integer representing the strength of the hand (higher is better)"""
-    for idx, type_matcher in enumerate(type_matchers):
-        matcher, matcher_key = type_matcher
-        if re.search(matcher, hand) is not None:
-            return (len(type_matchers) - idx, matcher_key)
-
-    return (0, 'HC')
+    signature = tuple(sorted(map(hand.count, set(hand)), reverse=True))
+    return hand_types[signature]
 
 
-def convert_hand_to_values(hand: str) -> List[int]:
-    return [ card_to_value_map[char] for char in hand ]
+def get_hand_sort_key(hand: str, hand_strength: int) -> int:
+    """Packs the hand strength and card values into one int that orders hands the same way as
+    comparing strength first, then each card in turn. Every card value fits in 4 bits, so the
+    strength ends up in the highest nibble above the five cards.
+    """
+    sort_key = hand_strength
+    for char in hand:
+        sort_key = (sort_key << 4) | card_to_value_map[char]
+    return sort_key
 
 def get_hands_by_strength(file: TextIOWrapper) -> List[HandResult]:
     """Returns every hand in the input data sorted by the hand type and strength,
     along with the bids for each
     """
-    # Sort each hand
-    # Pattern match to find type
-    # Sort all hands based on type, strength
-    # Do math
+    # Look up each hand's type from its card counts
+    # Pack type and cards into a single key, then sort on it once
     hands = []
     for line in file:
         hand, bid = line.split(' ')
-        sorted_hand = ''.join(sorted(hand))
-        hand_strength, hand_type_key = get_hand_type(sorted_hand)
-        hand_result = HandResult(hand=hand, hand_strength=hand_strength, hand_type_key=hand_type_key, bid=int(bid))
+        hand_strength, hand_type_key = get_hand_type(hand)
+        sort_key = get_hand_sort_key(hand, hand_strength)
+        hand_result = HandResult(hand=hand, hand_strength=hand_strength, hand_type_key=hand_type_key, bid=int(bid), sort_key=sort_key)
         hands.append(hand_result)
 
-    hands.sort(
-        key=lambda hand_result: convert_hand_to_values(attrgetter('hand')(hand_result)),
-    )
-    hands.sort(key=attrgetter('hand_strength'))
+    hands.sort(key=attrgetter('sort_key'))
 
     return hands
 
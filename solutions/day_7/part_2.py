@@ -1,23 +1,19 @@
 from typing import List
 from io import TextIOWrapper
 from dataclasses import dataclass
-import re
 from operator import attrgetter
 from pprint import pprint
-from collections import OrderedDict
 
-
-
-type_matchers = OrderedDict([
-    ('5oK', r'(\w)\1{4}'),
-    ('4oK', r'(\w)\1{3}'),
-    ('FH', r'(\w)\1{1}(\w)\2{2}|(\w)\3{2}(\w)\4{1}'),
-    ('3oK', r'(\w)\1{2}'),
-    ('2P', r'(\w)\1{1}.*(\w)\2{1}'),
-    ('1P', r'(\w)\1{1}'),
-    ('HC', r'.'),
-])
-type_strengths = { hand_type:idx+1 for idx, (hand_type, _) in enumerate(type_matchers.items()) }
+hand_types = {
+    (5,): (6, '5oK'),
+    (4, 1): (5, '4oK'),
+    (3, 2): (4, 'FH'),
+    (3, 1, 1): (3, '3oK'),
+    (2, 2, 1): (2, '2P'),
+    (2, 1, 1, 1): (1, '1P'),
+    (1, 1, 1, 1, 1): (0, 'HC'),
+}
+"""Hand strength and type key for each signature: how many of each card there are, most first"""
 
 
 card_to_value_map = {
@@ -30,76 +26,46 @@ class HandResult:
     hand_strength: int
     hand_type_key: str
     bid: int
-
-
-def upgrade_hand_with_wildcard(hand_type_key: str) -> str:
-    match hand_type_key:
-        case 'J':
-            return 'HC'
-        case 'HC':
-            return '1P'
-        case '1P':
-            return '3oK'
-        case '2P':
-            return 'FH'
-        case '3oK':
-            return '4oK'
-        case '4oK':
-            return '5oK'
-        case _:
-            raise ValueError(f'Unsupported hand_type_key: {hand_type_key}')
-
-
-def get_hand_type_with_wildcards(hand_type_key: str, wildcard_count: int) -> (int, str):
-    if wildcard_count >= 1:
-        next_hand_type_key = upgrade_hand_with_wildcard(hand_type_key)
-        return get_hand_type_with_wildcards(next_hand_type_key, wildcard_count - 1)
-    else:
-        return hand_type_key
+    sort_key: int
 
 
 def get_hand_type(hand: str) -> (int, str):
-    """Gets the hand type as an integer representing the strength of the hand (higher is better)"""
+    """Gets the hand type as an integer representing the strength of the hand (higher is better).
+    Jokers always do the most good by joining the biggest group of matching cards.
+    """
     hand_without_j = hand.replace('J', '')
     j_count = len(hand) - len(hand_without_j)
 
-    matched_hand_type_key: str
-    for hand_type_key, matcher in type_matchers.items():
-        if re.search(matcher, hand_without_j) is not None:
-            matched_hand_type_key = hand_type_key
-            break
-    else:
-        matched_hand_type_key = 'J'
-
-    upgraded_hand_type_key = get_hand_type_with_wildcards(matched_hand_type_key, j_count)
-    hand_strength = len(type_strengths) - type_strengths[upgraded_hand_type_key]
+    signature = sorted(map(hand_without_j.count, set(hand_without_j)), reverse=True) or [0]
+    signature[0] += j_count
+    return hand_types[tuple(signature)]
 
-    return (hand_strength, upgraded_hand_type_key)
 
-
-def convert_hand_to_values(hand: str) -> List[int]:
-    return [ card_to_value_map[char] for char in hand ]
+def get_hand_sort_key(hand: str, hand_strength: int) -> int:
+    """Packs the hand strength and card values into one int that orders hands the same way as
+    comparing strength first, then each card in turn. Every card value fits in 4 bits, so the
+    strength ends up in the highest nibble above the five cards.
+    """
+    sort_key = hand_strength
+    for char in hand:
+        sort_key = (sort_key << 4) | card_to_value_map[char]
+    return sort_key
 
 def get_hands_by_strength(file: TextIOWrapper) -> List[HandResult]:
     """Returns every hand in the input data sorted by the hand type and strength,
     along with the bids for each
     """
-    # Sort each hand
-    # Pattern match to find type
-    # Sort all hands based on type, strength
-    # Do math
+    # Look up each hand's type from its card counts
+    # Pack type and cards into a single key, then sort on it once
     hands = []
     for line in file:
         hand, bid = line.split(' ')
-        sorted_hand = ''.join(sorted(hand))
-        hand_strength, hand_type_key = get_hand_type(sorted_hand)
-        hand_result = HandResult(hand=hand, hand_strength=hand_strength, hand_type_key=hand_type_key, bid=int(bid))
+        hand_strength, hand_type_key = get_hand_type(hand)
+        sort_key = get_hand_sort_key(hand, hand_strength)
+        hand_result = HandResult(hand=hand, hand_strength=hand_strength, hand_type_key=hand_type_key, bid=int(bid), sort_key=sort_key)
         hands.append(hand_result)
 
-    hands.sort(
-        key=lambda hand_result: convert_hand_to_values(attrgetter('hand')(hand_result)),
-    )
-    hands.sort(key=attrgetter('hand_strength'))
+    hands.sort(key=attrgetter('sort_key'))
 
     return hands
 
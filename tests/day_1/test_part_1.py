@@ -0,0 +1,32 @@
+import unittest
+from solutions.day_1.part_1 import get_calibration_value, read_codes, sum_calibration_values, sum_calibration_values_bulk
+
+codes = [
+    '1abc2',
+    'pqr3stu8vwx',
+    'a1b2c3d4e5f',
+    'treb7uchet',
+]
+
+
+class TestDay1Part1(unittest.TestCase):
+    def test_calibration_value(self):
+        for mode in ['regex', 'bidirectional']:
+            for code, expected in zip(codes, [12, 38, 15, 77]):
+                with self.subTest(mode=mode, code=code):
+                    self.assertEqual(get_calibration_value(code, mode), expected)
+
+    def test_bulk_matches_per_line(self):
+        with self.subTest(input='example'):
+            data = '\n'.join(codes).encode()
+            self.assertEqual(sum_calibration_values_bulk(data), 142)
+
+        with self.subTest(input='resources'):
+            with open('resources/day_1_values.txt', encoding='utf-8') as file:
+                expected = sum_calibration_values(read_codes(file))
+            with open('resources/day_1_values.txt', 'rb') as file:
+                self.assertEqual(sum_calibration_values_bulk(file.read()), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from solutions.day_1.part_2 import NumberScanner, build_vocabulary, get_calibration_value
+
+modes = ['scan', 'bidirectional']
+
+
+class TestDay1Part2(unittest.TestCase):
+    def test_calibration_value(self):
+        cases = [
+            ('two1nine', 29),
+            ('eightwothree', 83),
+            ('abcone2threexyz', 13),
+            ('xtwone3four', 24),
+            ('4nineeightseven2', 42),
+            ('zoneight234', 14),
+            ('7pqrstsixteen', 76),
+            ('treb7uchet', 77),
+        ]
+        for mode in modes:
+            for code, expected in cases:
+                with self.subTest(mode=mode, code=code):
+                    self.assertEqual(get_calibration_value(code, mode), expected)
+
+    def test_overlapping_words(self):
+        cases = [
+            ('twone', 21),
+            ('oneight', 18),
+            ('sevenine', 79),
+            ('xeightwox', 82),
+        ]
+        for mode in modes:
+            for code, expected in cases:
+                with self.subTest(mode=mode, code=code):
+                    self.assertEqual(get_calibration_value(code, mode), expected)
+
+    def test_no_digits(self):
+        for mode in modes:
+            with self.subTest(mode=mode), self.assertRaises(ValueError):
+                get_calibration_value('abcdef', mode)
+
+    def test_multilingual_vocabulary(self):
+        scanner = NumberScanner(build_vocabulary(['en', 'de', 'fr'], { 'dozen': '2' }))
+        cases = [
+            ('xfünfzweiy', 52),
+            ('huitroisz', 83),
+            ('sechsone', 61),
+            ('adozeneins', 21),
+        ]
+        for mode in modes:
+            for code, expected in cases:
+                with self.subTest(mode=mode, code=code):
+                    self.assertEqual(get_calibration_value(code, mode, scanner), expected)
+
+    def test_conflicting_vocabulary(self):
+        with self.assertRaises(ValueError):
+            build_vocabulary(['en'], { 'one': '7' })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+import random
+import unittest
+from solutions.day_2.dominance_index import DominanceIndex
+
+
+def scan_games(game_nums: list[int], maxima: list[list[int]], cube_bag: list[int]) -> tuple[int, int]:
+    fitting_game_nums = [
+        game_num for game_num, vector in zip(game_nums, maxima)
+        if all(value <= count for value, count in zip(vector, cube_bag))
+    ]
+    return (len(fitting_game_nums), sum(fitting_game_nums))
+
+
+class TestDay2DominanceIndex(unittest.TestCase):
+    def test_matches_linear_scan(self):
+        rng = random.Random(2)
+        for dimensions in [1, 3, 6]:
+            game_nums = list(range(1, 501))
+            maxima = [ [ rng.randint(0, 15) for _ in range(dimensions) ] for _ in game_nums ]
+            dominance_index = DominanceIndex(game_nums, maxima)
+            for _ in range(50):
+                cube_bag = [ rng.randint(0, 17) for _ in range(dimensions) ]
+                with self.subTest(dimensions=dimensions, cube_bag=cube_bag):
+                    self.assertEqual(dominance_index.query(cube_bag), scan_games(game_nums, maxima, cube_bag))
+
+    def test_empty_index(self):
+        self.assertEqual(DominanceIndex([], []).query([1, 2, 3]), (0, 0))
+
+    def test_wrong_bag_size(self):
+        with self.assertRaises(ValueError):
+            DominanceIndex([1], [[1, 2, 3]]).query([1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from solutions.day_2.follow import GameLogAggregator
+from tests.day_2.test_part_1 import example_lines
+
+
+class TestDay2Follow(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.temp_dir.name, 'games.txt')
+        self.checkpoint_path = os.path.join(self.temp_dir.name, 'checkpoint.json')
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def append_to_log(self, text: str) -> None:
+        with open(self.log_path, 'a', encoding='utf-8') as log_file:
+            log_file.write(text)
+
+    def test_processes_only_appended_lines(self):
+        self.append_to_log('\n'.join(example_lines[:2]) + '\n' + example_lines[2][:20])
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path)
+        self.assertEqual(aggregator.process_new_lines(), 2)
+        self.assertEqual(aggregator.checkpoint.game_id_total, 3)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 60)
+
+        # Finish the partial line and add the rest
+        self.append_to_log(example_lines[2][20:] + '\n' + '\n'.join(example_lines[3:]) + '\n')
+        self.assertEqual(aggregator.process_new_lines(), 3)
+        self.assertEqual(aggregator.checkpoint.game_id_total, 8)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 2286)
+        self.assertEqual(aggregator.process_new_lines(), 0)
+
+    def test_resumes_from_checkpoint(self):
+        self.append_to_log('\n'.join(example_lines[:3]) + '\n')
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path)
+        aggregator.process_new_lines()
+        aggregator.save_checkpoint()
+
+        self.append_to_log('\n'.join(example_lines[3:]) + '\n')
+        restarted = GameLogAggregator(self.log_path, self.checkpoint_path)
+        self.assertEqual(restarted.process_new_lines(), 2)
+        self.assertEqual(restarted.checkpoint.game_id_total, 8)
+        self.assertEqual(restarted.checkpoint.total_cube_power, 2286)
+
+    def test_new_color_ignores_line_order(self):
+        lines = ['Game 1: 2 red, 1 green, 3 blue', 'Game 2: 1 red; 2 green, 4 blue, 1 teal', 'Game 3: 5 blue, 2 red, 1 green']
+        for ordered_lines in (lines, lines[::-1]):
+            with self.subTest(ordered_lines=ordered_lines):
+                with open(self.log_path, 'w', encoding='utf-8') as log_file:
+                    log_file.write('\n'.join(ordered_lines) + '\n')
+                aggregator = GameLogAggregator(self.log_path)
+                aggregator.process_new_lines()
+                self.assertEqual(aggregator.checkpoint.total_cube_power, 8)
+
+    def test_bag_color_missing_from_log(self):
+        self.append_to_log(example_lines[0] + '\n')
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path, { 'red': 12, 'green': 13, 'blue': 14, 'teal': 2 })
+        self.assertEqual(aggregator.process_new_lines(), 1)
+        self.assertEqual(aggregator.checkpoint.game_id_total, 1)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 48)
+        aggregator.save_checkpoint()
+        self.assertNotIn('teal', aggregator.checkpoint.colors)
+
+        # Once the log does use the color, the bag's count for it applies
+        self.append_to_log('Game 2: 1 red, 1 green, 1 blue, 2 teal\nGame 3: 1 red, 1 green, 1 blue, 3 teal\n')
+        self.assertEqual(aggregator.process_new_lines(), 2)
+        self.assertEqual(aggregator.checkpoint.game_id_total, 3)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 5)
+
+    def test_waits_for_missing_log(self):
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path)
+        self.assertEqual(aggregator.process_new_lines(), 0)
+        self.append_to_log(example_lines[0] + '\n')
+        self.assertEqual(aggregator.process_new_lines(), 1)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 48)
+
+    def test_restarts_after_rotation(self):
+        self.append_to_log('\n'.join(example_lines[:2]) + '\n')
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path)
+        aggregator.process_new_lines()
+        aggregator.save_checkpoint()
+
+        # The new log is already longer than the old one, so only its identity gives the rotation away
+        rotated_path = os.path.join(self.temp_dir.name, 'games.txt.new')
+        with open(rotated_path, 'w', encoding='utf-8') as log_file:
+            log_file.write('\n'.join(example_lines[2:]) + '\n')
+        os.replace(rotated_path, self.log_path)
+
+        restarted = GameLogAggregator(self.log_path, self.checkpoint_path)
+        self.assertEqual(restarted.process_new_lines(), 3)
+        self.assertEqual(restarted.checkpoint.game_id_total, 5)
+        self.assertEqual(restarted.checkpoint.total_cube_power, 1560 + 630 + 36)
+
+    def test_restarts_after_truncation(self):
+        self.append_to_log('\n'.join(example_lines) + '\n')
+        aggregator = GameLogAggregator(self.log_path, self.checkpoint_path)
+        aggregator.process_new_lines()
+
+        with open(self.log_path, 'w', encoding='utf-8') as log_file:
+            log_file.write(example_lines[0] + '\n')
+        self.assertEqual(aggregator.process_new_lines(), 1)
+        self.assertEqual(aggregator.checkpoint.game_id_total, 1)
+        self.assertEqual(aggregator.checkpoint.total_cube_power, 48)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+from io import StringIO
+from solutions.day_2.game_store import GameStore
+from solutions.day_2.part_1 import check_if_maxima_valid
+from solutions.day_2.records import ColorSchema, parse_game_maxima
+from tests.day_2.test_part_1 import example_lines
+
+
+class TestDay2GameStore(unittest.TestCase):
+    game_store: GameStore
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.game_store = GameStore.from_file(StringIO('\n'.join(example_lines)))
+
+    def test_valid_game_num_sums(self):
+        cube_bags = [
+            { 'red': red, 'green': green, 'blue': blue }
+            for red in range(0, 22, 3) for green in range(0, 15, 2) for blue in range(0, 16, 3)
+        ]
+        schema = ColorSchema()
+        games = [ parse_game_maxima(line, schema) for line in example_lines ]
+        expected = [
+            sum(
+                game_num for game_num, maxima in games
+                if check_if_maxima_valid(maxima, schema.vector(cube_bag))
+            )
+            for cube_bag in cube_bags
+        ]
+        self.assertEqual(self.game_store.valid_game_num_sums(cube_bags).tolist(), expected)
+
+    def test_chunked_query(self):
+        game_store = GameStore.from_file(StringIO('\n'.join(example_lines)))
+        game_store.max_chunk_cells = 10
+        cube_bags = game_store.bags_to_array([ { 'red': 12, 'green': 13, 'blue': 14 } ] * 10)
+        self.assertEqual(game_store.valid_game_num_sums(cube_bags).tolist(), [8] * 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
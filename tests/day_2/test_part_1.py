@@ -0,0 +1,42 @@
+import unittest
+from solutions.day_2.part_1 import check_if_maxima_valid
+from solutions.day_2.records import ColorSchema, default_colors, parse_game_maxima
+
+example_lines = [
+    'Game 1: 3 blue, 4 red; 1 red, 2 green, 6 blue; 2 green',
+    'Game 2: 1 blue, 2 green; 3 green, 4 blue, 1 red; 1 green, 1 blue',
+    'Game 3: 8 green, 6 blue, 20 red; 5 blue, 4 red, 13 green; 5 green, 1 red',
+    'Game 4: 1 green, 3 red, 6 blue; 3 green, 6 red; 3 green, 15 blue, 14 red',
+    'Game 5: 6 red, 1 blue, 3 green; 2 blue, 1 red, 2 green',
+]
+
+
+class TestDay2Part1(unittest.TestCase):
+    def test_parse_game_maxima(self):
+        schema = ColorSchema(default_colors)
+        game_num, maxima = parse_game_maxima(example_lines[2], schema)
+        self.assertEqual(game_num, 3)
+        self.assertEqual(schema.to_dict(maxima), { 'red': 20, 'green': 13, 'blue': 6 })
+
+    def test_valid_game_ids(self):
+        schema = ColorSchema(default_colors)
+        cube_bag = schema.vector({ 'red': 12, 'green': 13, 'blue': 14 })
+        valid_game_nums = [
+            game_num for game_num, maxima in (parse_game_maxima(line, schema) for line in example_lines)
+            if check_if_maxima_valid(maxima, cube_bag)
+        ]
+        self.assertEqual(valid_game_nums, [1, 2, 5])
+
+    def test_discovered_colors(self):
+        schema = ColorSchema()
+        _, first_maxima = parse_game_maxima('Game 1: 2 teal, 1 red; 4 teal', schema)
+        _, second_maxima = parse_game_maxima('Game 2: 3 mauve; 1 red, 1 mauve', schema)
+        self.assertEqual(schema.colors, ['teal', 'red', 'mauve'])
+        self.assertEqual(first_maxima, [4, 1])
+        self.assertEqual(second_maxima, [0, 1, 3])
+        self.assertTrue(check_if_maxima_valid(first_maxima, schema.vector({ 'teal': 4, 'red': 1 })))
+        self.assertFalse(check_if_maxima_valid(second_maxima, schema.vector({ 'teal': 4, 'red': 1 })))
+
+
+if __name__ == '__main__':
+    unittest.main()
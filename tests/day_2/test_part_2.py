@@ -0,0 +1,28 @@
+import unittest
+from solutions.day_2.part_2 import cube_bag_power, get_min_necessary_cubes, sum_cube_bag_powers
+from solutions.day_2.records import ColorSchema, default_colors, parse_game_maxima, parse_game_results
+from tests.day_2.test_part_1 import example_lines
+
+
+class TestDay2Part2(unittest.TestCase):
+    def test_min_necessary_cubes(self):
+        schema = ColorSchema(default_colors)
+        for line in example_lines:
+            with self.subTest(line=line):
+                _, maxima = parse_game_maxima(line, schema)
+                self.assertEqual(get_min_necessary_cubes(parse_game_results(line, schema), schema), maxima)
+
+    def test_cube_bag_power(self):
+        schema = ColorSchema(default_colors)
+        powers = [ cube_bag_power(parse_game_maxima(line, schema)[1], schema) for line in example_lines ]
+        self.assertEqual(powers, [48, 12, 1560, 630, 36])
+
+    def test_cube_bag_power_ignores_parse_order(self):
+        lines = ['Game 1: 2 red, 3 blue', 'Game 2: 1 red; 2 green, 4 blue', 'Game 3: 5 blue, 2 red']
+        for ordered_lines in (lines, lines[::-1]):
+            with self.subTest(ordered_lines=ordered_lines):
+                self.assertEqual(sum_cube_bag_powers(ordered_lines, ColorSchema()), 8)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+from solutions.day_2.records import ColorSchema, GameRecord, GameTable, parse_game_maxima
+
+
+class TestDay2Records(unittest.TestCase):
+    def test_append_and_get(self):
+        schema = ColorSchema(['red', 'blue'])
+        game_table = GameTable(schema)
+        game_table.append(7, [3, 4])
+        game_table.append(9, [5])
+        self.assertEqual(len(game_table), 2)
+        self.assertEqual(game_table[0], GameRecord(7, (3, 4)))
+        self.assertEqual(game_table[1], GameRecord(9, (5, 0)))
+        self.assertEqual(list(game_table), [GameRecord(7, (3, 4)), GameRecord(9, (5, 0))])
+
+    def test_widen_after_rows_exist(self):
+        schema = ColorSchema()
+        game_table = GameTable(schema)
+        lines = [
+            'Game 1: 2 red, 3 blue; 1 red',
+            'Game 2: 4 blue; 5 red',
+            'Game 3: 1 green, 6 red',
+            'Game 4: 2 teal; 3 blue, 7 green',
+            'Game 5: 8 red',
+        ]
+        for line in lines[:2]:
+            game_table.append(*parse_game_maxima(line, schema))
+        self.assertEqual(game_table.width, 2)
+
+        game_table.append(*parse_game_maxima(lines[2], schema))
+        self.assertEqual(game_table.width, 3)
+        self.assertEqual(list(game_table), [GameRecord(1, (2, 3, 0)), GameRecord(2, (5, 4, 0)), GameRecord(3, (6, 0, 1))])
+
+        for line in lines[3:]:
+            game_table.append(*parse_game_maxima(line, schema))
+        self.assertEqual(schema.colors, ['red', 'blue', 'green', 'teal'])
+        self.assertEqual(list(game_table), [
+            GameRecord(1, (2, 3, 0, 0)),
+            GameRecord(2, (5, 4, 0, 0)),
+            GameRecord(3, (6, 0, 1, 0)),
+            GameRecord(4, (0, 3, 7, 2)),
+            GameRecord(5, (8, 0, 0, 0)),
+        ])
+
+    def test_widen_without_appending(self):
+        schema = ColorSchema(['red'])
+        game_table = GameTable(schema)
+        game_table.append(1, [2])
+        schema.intern('blue')
+        self.assertEqual(game_table[0], GameRecord(1, (2,)))
+        game_table.widen()
+        self.assertEqual(game_table[0], GameRecord(1, (2, 0)))
+
+    def test_nbytes(self):
+        schema = ColorSchema(['red', 'green', 'blue'])
+        game_table = GameTable(schema)
+        self.assertEqual(game_table.nbytes(), 0)
+        for game_num in range(10):
+            game_table.append(game_num, [1, 2, 3])
+        self.assertEqual(game_table.nbytes(), 10 * (4 + 3 * 4))
+
+        schema.intern('teal')
+        game_table.widen()
+        self.assertEqual(game_table.nbytes(), 10 * (4 + 4 * 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
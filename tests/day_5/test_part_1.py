@@ -0,0 +1,224 @@
+import os
+import tempfile
+import unittest
+from io import StringIO
+from solutions.day_5.part_1 import IdMap, IdMapTree, merge_ranges, parse_seed_ranges
+
+example_seeds = [79, 14, 55, 13]
+example_almanac = """
+seed-to-soil map:
+50 98 2
+52 50 48
+
+soil-to-fertilizer map:
+0 15 37
+37 52 2
+39 0 15
+
+fertilizer-to-water map:
+49 53 8
+0 11 42
+42 0 7
+57 7 4
+
+water-to-light map:
+88 18 7
+18 25 70
+
+light-to-temperature map:
+45 77 23
+81 45 19
+68 64 13
+
+temperature-to-humidity map:
+0 69 1
+1 0 69
+
+humidity-to-location map:
+60 56 37
+56 93 4
+"""
+
+
+class TestDay5Part1(unittest.TestCase):
+    id_map_tree: IdMapTree
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.id_map_tree = IdMapTree.from_file(StringIO(example_almanac))
+
+    def test_find_location_from_seed(self):
+        locations = [ self.id_map_tree.find_location_from_seed(seed) for seed in example_seeds ]
+        self.assertEqual(locations, [82, 43, 86, 35])
+
+    def test_find_min_location_from_seed_ranges(self):
+        seed_ranges = parse_seed_ranges(example_seeds)
+        self.assertEqual(self.id_map_tree.find_min_location_from_seed_ranges(seed_ranges), 46)
+
+    def test_convert_range_matches_convert_value(self):
+        for map_key in self.id_map_tree.map_order:
+            with self.subTest(map_key=map_key):
+                converted_ranges = self.id_map_tree.convert_range((0, 120), map_key)
+                converted_values = [
+                    value
+                    for range_start, range_length in converted_ranges
+                    for value in range(range_start, range_start + range_length)
+                ]
+                self.assertEqual(converted_values, [ self.id_map_tree.convert_value(num, map_key) for num in range(120) ])
+
+    def test_composed_map_matches_stepwise(self):
+        with self.subTest(map_keys='seed-to-location'):
+            for seed in range(120):
+                self.assertEqual(
+                    self.id_map_tree.find_location_from_seed(seed),
+                    self.id_map_tree.find_location_from_seed_stepwise(seed),
+                )
+
+        with self.subTest(map_keys='soil-to-water'):
+            composed_map = self.id_map_tree.compose(['soil-to-fertilizer', 'fertilizer-to-water'])
+            for soil in range(120):
+                fertilizer = self.id_map_tree.convert_value(soil, 'soil-to-fertilizer')
+                self.assertEqual(composed_map.convert_value(soil), self.id_map_tree.convert_value(fertilizer, 'fertilizer-to-water'))
+
+    def test_convert_values_batch(self):
+        import numpy as np
+
+        seeds = np.arange(0, 120)
+        expected = [ self.id_map_tree.find_location_from_seed_stepwise(seed) for seed in range(120) ]
+        with self.subTest(path='per-map'):
+            self.assertEqual(self.id_map_tree.convert_values_batch(seeds).tolist(), expected)
+        with self.subTest(path='composed'):
+            self.assertEqual(self.id_map_tree.compose().convert_values_batch(seeds).tolist(), expected)
+
+    def test_reverse_lookup(self):
+        seed_count = 200
+        seeds_by_location: dict[int, list[int]] = {}
+        for seed in range(seed_count):
+            seeds_by_location.setdefault(self.id_map_tree.find_location_from_seed_stepwise(seed), []).append(seed)
+
+        for location in range(120):
+            with self.subTest(location=location):
+                seeds = [ seed for seed in self.id_map_tree.find_seeds_from_location(location) if seed < seed_count ]
+                self.assertEqual(seeds, seeds_by_location.get(location, []))
+
+        with self.subTest(map_key='seed-to-soil'):
+            self.assertEqual(self.id_map_tree.convert_value_reverse(51, 'seed-to-soil'), [99])
+            self.assertEqual(self.id_map_tree.convert_value_reverse(52, 'seed-to-soil'), [50])
+            self.assertEqual(self.id_map_tree.convert_value_reverse(10, 'seed-to-soil'), [10])
+            self.assertEqual(self.id_map_tree.convert_value_reverse(98, 'seed-to-soil'), [96])
+
+    def test_find_lowest_reachable_location(self):
+        with self.subTest(seeds='ranges'):
+            seed_ranges = parse_seed_ranges(example_seeds)
+            self.assertEqual(self.id_map_tree.find_lowest_reachable_location(seed_ranges), 46)
+
+        with self.subTest(seeds='single seeds'):
+            seed_ranges = [ (seed, 1) for seed in example_seeds ]
+            self.assertEqual(self.id_map_tree.find_lowest_reachable_location(seed_ranges), 35)
+
+    def test_separate_almanacs(self):
+        other_tree = IdMapTree.from_file(StringIO('seed-to-soil map:\n0 1000 10\n'))
+        self.assertEqual(other_tree.convert_value(1005, 'seed-to-soil'), 5)
+        self.assertEqual(self.id_map_tree.convert_value(1005, 'seed-to-soil'), 1005)
+        self.assertNotIn('soil-to-fertilizer', other_tree.map_arrays)
+
+    def test_snapshot_round_trip(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            snapshot_path = os.path.join(temp_dir, 'almanac.idmt')
+            with open(snapshot_path, 'wb') as snapshot_file:
+                self.id_map_tree.save_snapshot(snapshot_file)
+
+            loaded_tree = IdMapTree.load_snapshot(snapshot_path)
+            self.assertEqual(repr(loaded_tree), repr(self.id_map_tree))
+            for seed in range(120):
+                self.assertEqual(loaded_tree.find_location_from_seed(seed), self.id_map_tree.find_location_from_seed(seed))
+            self.assertEqual(loaded_tree.convert_values_batch(range(120)).tolist(), [ self.id_map_tree.find_location_from_seed(seed) for seed in range(120) ])
+
+            # Loaded maps can still be changed, without touching the snapshot
+            loaded_tree.add_id_map_sorted('seed-to-soil', IdMap(source_range_start=0, target_range_start=500, range_length=10))
+            self.assertEqual(loaded_tree.convert_value(3, 'seed-to-soil'), 503)
+            self.assertEqual(IdMapTree.load_snapshot(snapshot_path).convert_value(3, 'seed-to-soil'), 3)
+
+    def test_category_queries(self):
+        self.assertEqual(self.id_map_tree.map_order[0], 'seed-to-soil')
+        self.assertEqual(len(self.id_map_tree.map_order), 7)
+        self.assertEqual(
+            self.id_map_tree.find_map_chain('soil', 'water'),
+            ['soil-to-fertilizer', 'fertilizer-to-water'],
+        )
+        for soil in range(120):
+            with self.subTest(soil=soil):
+                fertilizer = self.id_map_tree.convert_value(soil, 'soil-to-fertilizer')
+                water = self.id_map_tree.convert_value(fertilizer, 'fertilizer-to-water')
+                self.assertEqual(self.id_map_tree.convert_category(soil, 'soil', 'water'), water)
+
+        with self.assertRaises(ValueError):
+            self.id_map_tree.find_map_chain('location', 'seed')
+
+    def test_composed_map_cache(self):
+        id_map_tree = IdMapTree.from_file(StringIO(example_almanac))
+        id_map_tree.composed_map_cache_size = 2
+        soil_to_water = id_map_tree.get_composed_map('soil', 'water')
+        self.assertIs(id_map_tree.get_composed_map('soil', 'water'), soil_to_water)
+
+        # Using soil-to-water again makes seed-to-soil the least recently used, so it gets dropped
+        seed_to_soil = id_map_tree.get_composed_map('seed', 'soil')
+        id_map_tree.get_composed_map('soil', 'water')
+        id_map_tree.get_composed_map('light', 'location')
+        self.assertIs(id_map_tree.get_composed_map('soil', 'water'), soil_to_water)
+        self.assertIsNot(id_map_tree.get_composed_map('seed', 'soil'), seed_to_soil)
+
+        # Changing a map throws away everything composed from the old maps
+        id_map_tree.add_id_map_sorted('soil-to-fertilizer', IdMap(source_range_start=200, target_range_start=0, range_length=5))
+        self.assertIsNot(id_map_tree.get_composed_map('soil', 'water'), soil_to_water)
+
+    def test_convert_values_sweep(self):
+        seeds = [ 97, 3, 79, 14, 55, 13, 200, 0, 79, 51 ]
+        expected = [ self.id_map_tree.find_location_from_seed_stepwise(seed) for seed in seeds ]
+        self.assertEqual(self.id_map_tree.convert_values_sweep(seeds), expected)
+
+        with self.assertRaises(ValueError):
+            list(self.id_map_tree.get_location_map().convert_sorted_values([5, 3]))
+
+    def test_map_reports(self):
+        id_map_tree = IdMapTree.from_file(StringIO(example_almanac))
+        seed_to_soil = id_map_tree.map_reports['seed-to-soil']
+        self.assertEqual(seed_to_soil.range_count, 2)
+        self.assertEqual(seed_to_soil.overlaps, [])
+        self.assertEqual(seed_to_soil.span, (50, 50))
+        self.assertEqual(seed_to_soil.coverage, 1.0)
+
+        with self.assertRaises(ValueError):
+            id_map_tree.add_id_map_sorted('seed-to-soil', IdMap(source_range_start=95, target_range_start=0, range_length=5))
+
+        id_map_tree.add_id_map_sorted('seed-to-soil', IdMap(source_range_start=10, target_range_start=0, range_length=5))
+        seed_to_soil = id_map_tree.validate()['seed-to-soil']
+        self.assertEqual(seed_to_soil.gaps, [(15, 35)])
+        self.assertEqual(seed_to_soil.span, (10, 90))
+        self.assertEqual(seed_to_soil.covered_length, 55)
+
+    def test_overlap_policies(self):
+        overlapping_almanac = "a-to-b map:\n0 10 10\n100 15 10\n200 0 12\n"
+        with self.assertRaises(ValueError):
+            IdMapTree.from_file(StringIO(overlapping_almanac))
+
+        cases = {
+            'first': { 9: 209, 10: 0, 19: 9, 20: 105, 24: 109, 25: 25 },
+            'last': { 9: 209, 11: 211, 12: 2, 14: 4, 15: 100, 24: 109, 25: 25 },
+        }
+        for overlap_policy, expected in cases.items():
+            with self.subTest(overlap_policy=overlap_policy):
+                id_map_tree = IdMapTree.from_file(StringIO(overlapping_almanac), overlap_policy)
+                self.assertEqual(len(id_map_tree.map_reports['a-to-b'].overlaps), 2)
+                resolved_report = id_map_tree.validate()['a-to-b']
+                self.assertEqual(resolved_report.overlaps, [])
+                self.assertEqual(resolved_report.covered_length, 25)
+                for value, converted in expected.items():
+                    self.assertEqual(id_map_tree.convert_value(value, 'a-to-b'), converted)
+
+    def test_merge_ranges(self):
+        self.assertEqual(merge_ranges([(10, 5), (0, 3), (3, 2), (12, 10), (30, 0)]), [(0, 5), (10, 12)])
+
+
+if __name__ == '__main__':
+    unittest.main()
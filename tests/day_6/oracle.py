@@ -0,0 +1,16 @@
+"""An exact count of winning hold times for checking the day_6 solvers against, shared by the
+tests and the precision benchmark
+"""
+
+def count_winning_times_bisect(race_time: int, best_distance: int) -> int:
+    """Counts winning hold times by bisecting for the first one, using nothing but integer
+    comparisons. Distances only rise up to half the race time, so there's a single crossover.
+    """
+    low, high = 0, race_time // 2 + 1
+    while low < high:
+        mid = (low + high) // 2
+        if mid * (race_time - mid) > best_distance:
+            high = mid
+        else:
+            low = mid + 1
+    return max(race_time - 2 * low + 1, 0)
@@ -0,0 +1,81 @@
+import random
+import unittest
+from io import StringIO
+from solutions.day_6.part_1 import calculate_button_hold_times_exact, count_winning_times_batch, max_batch_race_time, parse_races, winning_times_product
+from tests.day_6.oracle import count_winning_times_bisect
+
+example_races = [
+    { "time": 7, "distance": 9, "ways_to_win": 4 },
+    { "time": 15, "distance": 40, "ways_to_win": 8 },
+    { "time": 30, "distance": 200, "ways_to_win": 9 },
+]
+
+example_sheet = """Time:      7  15   30
+Distance:  9  40  200
+"""
+
+class TestDay6Part1(unittest.TestCase):
+    def test_parse_races(self):
+        races = parse_races(StringIO(example_sheet))
+        self.assertEqual(races, [ { "time": race["time"], "distance": race["distance"] } for race in example_races ])
+
+        with self.assertRaises(ValueError):
+            parse_races(StringIO("Time: 7 15\nDistance: 9\n"))
+
+    def test_example_races(self):
+        for race in example_races:
+            with self.subTest(race=race):
+                time_range = calculate_button_hold_times_exact(race["time"], race["distance"])
+                self.assertEqual(time_range.stop - time_range.start + 1, race["ways_to_win"])
+
+    def test_exact_matches_brute_force(self):
+        for race_time in range(40):
+            for best_distance in range(-1, race_time * race_time // 4 + 2):
+                with self.subTest(race_time=race_time, best_distance=best_distance):
+                    winning_times = [ hold for hold in range(race_time + 1) if hold * (race_time - hold) > best_distance ]
+                    time_range = calculate_button_hold_times_exact(race_time, best_distance)
+                    self.assertEqual(time_range.stop - time_range.start + 1, len(winning_times))
+                    if winning_times:
+                        self.assertEqual((time_range.start, time_range.stop), (winning_times[0], winning_times[-1]))
+
+    def test_batch_matches_exact(self):
+        races = [ (race_time, best_distance) for race_time in range(40) for best_distance in range(-1, race_time * race_time // 4 + 2) ]
+        races += [ (max_batch_race_time, max_batch_race_time ** 2 // 4 - offset) for offset in (0, 1, 2, 10 ** 6, 10 ** 15) ]
+        race_times, best_distances = zip(*races)
+        counts = count_winning_times_batch(race_times, best_distances).tolist()
+        for (race_time, best_distance), count in zip(races, counts):
+            with self.subTest(race_time=race_time, best_distance=best_distance):
+                time_range = calculate_button_hold_times_exact(race_time, best_distance)
+                self.assertEqual(count, time_range.stop - time_range.start + 1)
+
+        with self.assertRaises(ValueError):
+            count_winning_times_batch([max_batch_race_time + 1], [0])
+
+    def test_winning_times_product(self):
+        counts = count_winning_times_batch([ race["time"] for race in example_races ], [ race["distance"] for race in example_races ])
+        self.assertEqual(winning_times_product(counts), 288)
+        self.assertEqual(winning_times_product(range(1, 30)), 29 * 28 * winning_times_product(range(1, 28)))
+        self.assertEqual(winning_times_product([3, 0, 5]), 0)
+        self.assertEqual(winning_times_product([]), 1)
+
+    def test_exact_across_magnitudes(self):
+        rng = random.Random(6)
+        for magnitude in range(1, 201):
+            race_time = rng.randrange(10 ** magnitude, 10 ** (magnitude + 1))
+            best_possible = (race_time // 2) * (race_time - race_time // 2)
+            for best_distance in (rng.randint(0, best_possible), best_possible - rng.randint(1, race_time), best_possible - 1, best_possible):
+                with self.subTest(race_time=race_time, best_distance=best_distance):
+                    time_range = calculate_button_hold_times_exact(race_time, best_distance)
+                    self.assertEqual(time_range.stop - time_range.start + 1, count_winning_times_bisect(race_time, best_distance))
+
+    def test_huge_race(self):
+        race_time = 10 ** 120 + 1
+        best_distance = race_time * race_time // 4 - 10 ** 30
+        time_range = calculate_button_hold_times_exact(race_time, best_distance)
+        self.assertEqual(time_range.stop - time_range.start + 1, 2 * 10 ** 15)
+        self.assertGreater(time_range.start * (race_time - time_range.start), best_distance)
+        self.assertLessEqual((time_range.start - 1) * (race_time - time_range.start + 1), best_distance)
+
+
+if __name__ == '__main__':
+    unittest.main()
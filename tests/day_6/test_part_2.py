@@ -0,0 +1,20 @@
+import unittest
+from io import StringIO
+from solutions.day_6.part_2 import calculate_button_hold_times, calculate_button_hold_times_exact, parse_race
+
+class TestDay6Part2(unittest.TestCase):
+    def test_parse_race(self):
+        race = parse_race(StringIO("Time:      7  15   30\nDistance:  9  40  200\n"))
+        self.assertEqual(race, { "time": 71530, "distance": 940200 })
+
+    def test_example_race(self):
+        time_range = calculate_button_hold_times_exact(71530, 940200)
+        self.assertEqual(time_range.stop - time_range.start + 1, 71503)
+
+    def test_exact_matches_search(self):
+        race = { "time": 56977793, "distance": 499221010971440 }
+        self.assertEqual(calculate_button_hold_times_exact(race["time"], race["distance"]), calculate_button_hold_times(race["time"], race["distance"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
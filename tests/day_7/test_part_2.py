@@ -0,0 +1,32 @@
+import unittest
+from io import StringIO
+from solutions.day_7.part_2 import calculate_winnings, card_to_value_map, get_hand_sort_key, get_hand_type, get_hands_by_strength
+from tests.day_7.test_part_1 import example_hands
+
+class TestDay7Part2(unittest.TestCase):
+    def test_get_hand_type(self):
+        cases = { 'JJJJJ': '5oK', 'AJJJJ': '5oK', 'QJJQ2': '4oK', '2233J': 'FH', 'T55J5': '4oK', 'A2J34': '1P', 'KTJJT': '4oK', '2345J': '1P', '23456': 'HC' }
+        for hand, hand_type_key in cases.items():
+            with self.subTest(hand=hand):
+                self.assertEqual(get_hand_type(hand)[1], hand_type_key)
+
+    def test_get_hand_sort_key(self):
+        for hand, hand_strength in [('JJJJJ', 6), ('2345J', 1)]:
+            with self.subTest(hand=hand):
+                expected = (hand_strength, *[ card_to_value_map[char] for char in hand ])
+                sort_key = get_hand_sort_key(hand, hand_strength)
+                self.assertEqual(tuple((sort_key >> shift) & 0xF for shift in range(20, -1, -4)), expected)
+
+        hands = ['2AAAA', '33332', 'T55J5', 'KK677', 'KTJJT']
+        by_key = sorted(hands, key=lambda hand: get_hand_sort_key(hand, get_hand_type(hand)[0]))
+        by_tuple = sorted(hands, key=lambda hand: (get_hand_type(hand)[0], *[ card_to_value_map[char] for char in hand ]))
+        self.assertEqual(by_key, by_tuple)
+
+    def test_winnings(self):
+        hands_by_strength = get_hands_by_strength(StringIO(example_hands))
+        self.assertEqual([ hand_result.hand for hand_result in hands_by_strength ], ['32T3K', 'KK677', 'T55J5', 'QQQJA', 'KTJJT'])
+        self.assertEqual(calculate_winnings(hands_by_strength), 5905)
+
+
+if __name__ == '__main__':
+    unittest.main()